@@ -17,7 +17,7 @@ from datetime import datetime
 from .base import BaseAgent
 
 logger = logging.getLogger(__name__)
-from ..tools.memory import read_from_memory, save_to_memory, aggregate_research
+from ..tools.memory import read_from_memory, save_to_memory, save_version, aggregate_research
 from ..models.content import ContentSession, ContentVersion, AgentState
 from ..models.parameters import GenerationParameters
 from ..config import settings
@@ -178,7 +178,7 @@ Write the complete content now:"""
         )
         self.session.versions.append(version)
 
-        save_to_memory(self.session_id, f"versions/v{version_num}", {
+        save_version(self.session_id, version_num, {
             "version_number": version_num,
             "content": content,
             "generated_at": datetime.utcnow().isoformat()
@@ -247,7 +247,7 @@ Write in markdown format with inline citations as markdown links [source title](
         logger.info("Stream complete for session %s (%d chars generated)", self.session_id, len(full_content))
         version_num = len(self.session.versions) + 1
 
-        save_to_memory(self.session_id, f"versions/v{version_num}", {
+        save_version(self.session_id, version_num, {
             "version_number": version_num,
             "content": full_content,
             "generated_at": datetime.utcnow().isoformat()
@@ -15,7 +15,7 @@ from datetime import datetime
 
 from .base import BaseAgent
 from .research import ResearchTask, run_parallel_research
-from ..tools.memory import read_from_memory, save_to_memory, aggregate_research
+from ..tools.memory import read_from_memory, save_version, aggregate_research
 from ..models.content import ContentSession, ContentVersion, AgentState
 from ..config import settings
 
@@ -150,7 +150,7 @@ Rewrite the content incorporating the feedback. Maintain the overall structure u
         )
         self.session.versions.append(version)
 
-        save_to_memory(self.session_id, f"versions/v{version_num}", {
+        save_version(self.session_id, version_num, {
             "version_number": version_num,
             "content": new_content,
             "feedback_applied": feedback,
@@ -204,7 +204,7 @@ Rewrite incorporating the feedback. IMPORTANT: Preserve all existing source cita
         full_content = "".join(content_parts)
         version_num = len(self.session.versions) + 1
 
-        save_to_memory(self.session_id, f"versions/v{version_num}", {
+        save_version(self.session_id, version_num, {
             "version_number": version_num,
             "content": full_content,
             "feedback_applied": feedback,
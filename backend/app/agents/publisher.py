@@ -8,9 +8,10 @@ Key responsibilities:
 4. Verify citations and links
 """
 
+import functools
 import httpx
 import markdown
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from datetime import datetime
 from pathlib import Path
 
@@ -19,6 +20,138 @@ from ..tools.memory import read_from_memory, save_to_memory
 from ..models.content import ContentSession, AgentState
 from ..config import settings
 
+_HTML_STYLES = """    <style>
+        * {
+            box-sizing: border-box;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 2rem;
+            line-height: 1.7;
+            color: #333;
+            background: #fafafa;
+        }
+        article {
+            background: white;
+            padding: 3rem;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #1a1a1a;
+            font-size: 2.5rem;
+            margin-bottom: 1.5rem;
+            line-height: 1.2;
+        }
+        h2 {
+            color: #2a2a2a;
+            font-size: 1.75rem;
+            margin-top: 2.5rem;
+            margin-bottom: 1rem;
+            padding-bottom: 0.5rem;
+            border-bottom: 2px solid #eee;
+        }
+        h3 {
+            color: #3a3a3a;
+            font-size: 1.35rem;
+            margin-top: 2rem;
+        }
+        p {
+            margin-bottom: 1.25rem;
+        }
+        a {
+            color: #0066cc;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+        code {
+            background: #f4f4f4;
+            padding: 0.2em 0.4em;
+            border-radius: 4px;
+            font-family: 'SF Mono', Monaco, 'Courier New', monospace;
+            font-size: 0.9em;
+        }
+        pre {
+            background: #2d2d2d;
+            color: #f8f8f2;
+            padding: 1.25rem;
+            border-radius: 8px;
+            overflow-x: auto;
+            margin: 1.5rem 0;
+        }
+        pre code {
+            background: none;
+            padding: 0;
+            color: inherit;
+        }
+        blockquote {
+            border-left: 4px solid #0066cc;
+            margin: 1.5rem 0;
+            padding: 0.5rem 0 0.5rem 1.5rem;
+            color: #555;
+            background: #f9f9f9;
+            border-radius: 0 4px 4px 0;
+        }
+        ul, ol {
+            margin-bottom: 1.25rem;
+            padding-left: 1.5rem;
+        }
+        li {
+            margin-bottom: 0.5rem;
+        }
+        img {
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+            margin: 1.5rem 0;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin: 1.5rem 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 0.75rem;
+            text-align: left;
+        }
+        th {
+            background: #f5f5f5;
+            font-weight: 600;
+        }
+        .meta {
+            color: #666;
+            font-size: 0.9rem;
+            margin-bottom: 2rem;
+            padding-bottom: 1rem;
+            border-bottom: 1px solid #eee;
+        }
+    </style>
+"""
+
+_HTML_FOOTER = """    <footer style="text-align: center; margin-top: 2rem; color: #888; font-size: 0.85rem;">
+        Generated by Content Creation Engine
+    </footer>
+"""
+
+
+@functools.lru_cache(maxsize=64)
+def _render_markdown(content: str) -> str:
+    """
+    Convert markdown to HTML, memoized on the content.
+
+    Styled and unstyled exports of the same version, and repeated exports
+    across requests, share one markdown pass.
+    """
+    return markdown.markdown(
+        content,
+        extensions=['fenced_code', 'tables', 'toc', 'nl2br']
+    )
+
 
 class PublisherAgent(BaseAgent):
     """
@@ -57,10 +190,7 @@ class PublisherAgent(BaseAgent):
 
     def _markdown_to_html(self, content: str) -> str:
         """Convert markdown to HTML."""
-        return markdown.markdown(
-            content,
-            extensions=['fenced_code', 'tables', 'toc', 'nl2br']
-        )
+        return _render_markdown(content)
 
     async def _check_mcp_support(self, site_url: str) -> bool:
         """Check if WordPress site supports MCP protocol."""
@@ -229,170 +359,64 @@ class PublisherAgent(BaseAgent):
 
         return publish_result
 
-    def export_to_html(self, include_styles: bool = True) -> Dict[str, Any]:
-        """
-        Export content as standalone HTML file.
-
-        Returns:
-            HTML content and suggested filename
+    def _html_chunks(self, title: str, html_body: str, include_styles: bool) -> Iterator[str]:
         """
-        self.status = "exporting"
-        self.current_task = "exporting to HTML"
+        Yield a standalone HTML document in pieces.
 
-        content = self._get_current_content()
-        title = self._extract_title(content)
-        html_body = self._markdown_to_html(content)
+        Args:
+            title: Document title
+            html_body: Rendered article HTML
+            include_styles: Whether to include the stylesheet and footer
 
-        if include_styles:
-            html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <style>
-        * {{
-            box-sizing: border-box;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 2rem;
-            line-height: 1.7;
-            color: #333;
-            background: #fafafa;
-        }}
-        article {{
-            background: white;
-            padding: 3rem;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #1a1a1a;
-            font-size: 2.5rem;
-            margin-bottom: 1.5rem;
-            line-height: 1.2;
-        }}
-        h2 {{
-            color: #2a2a2a;
-            font-size: 1.75rem;
-            margin-top: 2.5rem;
-            margin-bottom: 1rem;
-            padding-bottom: 0.5rem;
-            border-bottom: 2px solid #eee;
-        }}
-        h3 {{
-            color: #3a3a3a;
-            font-size: 1.35rem;
-            margin-top: 2rem;
-        }}
-        p {{
-            margin-bottom: 1.25rem;
-        }}
-        a {{
-            color: #0066cc;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-        code {{
-            background: #f4f4f4;
-            padding: 0.2em 0.4em;
-            border-radius: 4px;
-            font-family: 'SF Mono', Monaco, 'Courier New', monospace;
-            font-size: 0.9em;
-        }}
-        pre {{
-            background: #2d2d2d;
-            color: #f8f8f2;
-            padding: 1.25rem;
-            border-radius: 8px;
-            overflow-x: auto;
-            margin: 1.5rem 0;
-        }}
-        pre code {{
-            background: none;
-            padding: 0;
-            color: inherit;
-        }}
-        blockquote {{
-            border-left: 4px solid #0066cc;
-            margin: 1.5rem 0;
-            padding: 0.5rem 0 0.5rem 1.5rem;
-            color: #555;
-            background: #f9f9f9;
-            border-radius: 0 4px 4px 0;
-        }}
-        ul, ol {{
-            margin-bottom: 1.25rem;
-            padding-left: 1.5rem;
-        }}
-        li {{
-            margin-bottom: 0.5rem;
-        }}
-        img {{
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            margin: 1.5rem 0;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin: 1.5rem 0;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 0.75rem;
-            text-align: left;
-        }}
-        th {{
-            background: #f5f5f5;
-            font-weight: 600;
-        }}
-        .meta {{
-            color: #666;
-            font-size: 0.9rem;
-            margin-bottom: 2rem;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid #eee;
-        }}
-    </style>
-</head>
-<body>
-    <article>
-        {html_body}
-    </article>
-    <footer style="text-align: center; margin-top: 2rem; color: #888; font-size: 0.85rem;">
-        Generated by Content Creation Engine
-    </footer>
-</body>
-</html>"""
-        else:
-            html = f"""<!DOCTYPE html>
+        Yields:
+            Consecutive chunks of the document
+        """
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-</head>
+"""
+        if include_styles:
+            yield _HTML_STYLES
+        yield """</head>
 <body>
     <article>
-        {html_body}
+        """
+        yield html_body
+        yield """
     </article>
-</body>
+"""
+        if include_styles:
+            yield _HTML_FOOTER
+        yield """</body>
 </html>"""
 
+    def export_to_html_stream(self, include_styles: bool = True) -> Dict[str, Any]:
+        """
+        Export content as a standalone HTML document produced in chunks.
+
+        Lets callers write the document straight to a file without first
+        building it as one string.
+
+        Returns:
+            Chunk iterator ("chunks") and suggested filename
+        """
+        self.status = "exporting"
+        self.current_task = "exporting to HTML"
+
+        content = self._get_current_content()
+        title = self._extract_title(content)
+        html_body = self._markdown_to_html(content)
+
         # Generate filename
         safe_title = "".join(c if c.isalnum() or c in (' ', '-', '_') else '' for c in title)
         safe_title = safe_title.replace(' ', '-').lower()[:50]
         filename = f"{safe_title}.html"
 
         export_result = {
-            "html": html,
+            "chunks": self._html_chunks(title, html_body, include_styles),
             "filename": filename,
             "title": title,
             "exported_at": datetime.utcnow().isoformat()
@@ -410,6 +434,19 @@ class PublisherAgent(BaseAgent):
 
         return export_result
 
+    def export_to_html(self, include_styles: bool = True) -> Dict[str, Any]:
+        """
+        Export content as standalone HTML file.
+
+        Returns:
+            HTML content and suggested filename
+        """
+        export_result = self.export_to_html_stream(include_styles)
+        return {
+            "html": "".join(export_result.pop("chunks")),
+            **export_result
+        }
+
     async def verify_citations(self) -> Dict[str, Any]:
         """
         Verify that citations/links in content are valid.
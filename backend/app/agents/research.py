@@ -14,7 +14,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from .base import BaseAgent
-from ..tools.search import search_web
+from ..tools.search import search_web_batch
 from ..tools.scrape import scrape_url
 from ..tools.memory import save_to_memory
 from ..models.content import AgentState
@@ -127,14 +127,12 @@ class ResearchSubagent(BaseAgent):
         all_results = []
 
         # First 2 queries are broad
-        for query in self.task.search_queries[:2]:
-            self.tool_calls += 1
-            try:
-                results = await search_web(query, limit=5)
+        queries = self.task.search_queries[:2]
+        self.tool_calls += len(queries)
+        for results in await search_web_batch(queries, limit=5):
+            # Skip queries that failed and continue with the rest
+            if not isinstance(results, BaseException):
                 all_results.extend(results)
-            except Exception:
-                # Continue with other queries if one fails
-                pass
 
         return all_results
 
@@ -203,13 +201,11 @@ Only return the numbers, like: 0, 2, 5"""
         all_results = []
 
         # Remaining queries are narrow
-        for query in self.task.search_queries[2:]:
-            self.tool_calls += 1
-            try:
-                results = await search_web(query, limit=3)
+        queries = self.task.search_queries[2:]
+        self.tool_calls += len(queries)
+        for results in await search_web_batch(queries, limit=3):
+            if not isinstance(results, BaseException):
                 all_results.extend(results)
-            except Exception:
-                pass
 
         return all_results
 
@@ -35,6 +35,11 @@ class Settings(BaseSettings):
 
     # Memory Storage
     memory_base_path: Path = Path("app/memory")
+    memory_backend: str = "filesystem"  # filesystem, sqlite or memory
+    use_io_uring: bool = False  # Batch memory reads via liburing (Linux only)
+
+    # Firecrawl scrape/deep-research result cache lifetime in seconds (0 disables)
+    scrape_cache_ttl: int = 86400
 
     class Config:
         env_file = ".env"
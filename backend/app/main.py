@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
 from .routers import sessions_router, research_router, generate_router, publish_router
+from .tools.http_client import close_client
 
 # Configure logging
 log_level = logging.DEBUG if settings.debug else logging.INFO
@@ -70,6 +71,12 @@ async def startup_event():
     logger.info("API endpoints ready: sessions, research, generate, publish")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared resources on shutdown."""
+    await close_client()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -5,9 +5,9 @@ Content session and research models.
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from .parameters import GenerationParameters
 
@@ -76,3 +76,20 @@ class ContentSession(BaseModel):
     agents: List[AgentState] = Field(default_factory=list)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Serialized API views, keyed by name -> (invalidation token, view)
+    _view_cache: Dict[str, Tuple[Any, Any]] = PrivateAttr(default_factory=dict)
+
+    def cached_view(self, name: str, token: Any, build: Callable[[], Any]) -> Any:
+        """
+        Return a cached serialized view of this session.
+
+        The view is rebuilt with `build` whenever `token` differs from the
+        token it was last built with. Callers must not mutate the result.
+        """
+        cached = self._view_cache.get(name)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        view = build()
+        self._view_cache[name] = (token, view)
+        return view
@@ -0,0 +1,146 @@
+"""
+Shared FastAPI dependencies for the API routers.
+"""
+
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type, TypeVar
+
+import msgspec
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel
+
+T = TypeVar("T", bound=msgspec.Struct)
+
+# Path suffix msgspec appends to validation messages, e.g. " - at `$.parameters[0]`"
+_ERROR_PATH = re.compile(r" - at `\$(.*)`$")
+_PATH_PART = re.compile(r"\.([^.\[]+)|\[(\d+)\]")
+_MISSING_FIELD = re.compile(r"^Object missing required field `(.+)`$")
+
+
+def _msgspec_errors(error: msgspec.MsgspecError) -> List[Dict[str, Any]]:
+    """
+    Convert a msgspec decode error into FastAPI's list-of-errors format.
+
+    Args:
+        error: The ValidationError or DecodeError raised while decoding
+
+    Returns:
+        Error entries shaped like those of a RequestValidationError
+    """
+    message = str(error)
+    if not isinstance(error, msgspec.ValidationError):
+        return [{
+            "type": "json_invalid",
+            "loc": ["body"],
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": message},
+        }]
+
+    loc: List[Any] = ["body"]
+    path = _ERROR_PATH.search(message)
+    if path:
+        message = message[:path.start()]
+        for key, index in _PATH_PART.findall(path.group(1)):
+            loc.append(key if key else int(index))
+
+    missing = _MISSING_FIELD.match(message)
+    if missing:
+        return [{"type": "missing", "loc": loc + [missing.group(1)], "msg": "Field required"}]
+    return [{"type": "value_error", "loc": loc, "msg": message}]
+
+
+def msgspec_body(struct_type: Type[T]) -> Callable[[Request], Awaitable[T]]:
+    """
+    Build a dependency that decodes the JSON request body into a msgspec Struct.
+
+    Decoding and validation happen in a single native pass instead of going
+    through Pydantic. Invalid bodies are rejected with the same 422 response
+    FastAPI returns for Pydantic request models.
+
+    Args:
+        struct_type: The msgspec Struct class to decode into
+
+    Returns:
+        An async dependency suitable for Depends()
+    """
+    decoder = msgspec.json.Decoder(struct_type)
+
+    async def decode_body(request: Request) -> T:
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise RequestValidationError(_msgspec_errors(e))
+
+    return decode_body
+
+
+def _inline_model_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Get a Pydantic model's JSON schema with its $defs references inlined.
+
+    Args:
+        model: The Pydantic model class
+
+    Returns:
+        Self-contained JSON schema for the model
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                extra = {k: v for k, v in node.items() if k != "$ref"}
+                return resolve({**defs[ref[len("#/$defs/"):]], **extra})
+            return {k: resolve(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [resolve(v) for v in node]
+        return node
+
+    return resolve(schema)
+
+
+def msgspec_openapi(
+    struct_type: Type[msgspec.Struct],
+    models: Optional[Dict[str, Type[BaseModel]]] = None
+) -> Dict[str, Any]:
+    """
+    Build an openapi_extra entry documenting a msgspec request body.
+
+    The schema is inlined, so this is intended for flat Structs whose
+    fields do not reference other Structs.
+
+    Args:
+        struct_type: The msgspec Struct class used for the request body
+        models: Optional mapping of field name to the Pydantic model its
+            (dict-typed) value is validated against, documented in its place
+
+    Returns:
+        Dictionary to pass as a route's openapi_extra
+    """
+    _, components = msgspec.json.schema_components([struct_type])
+    schema = components[struct_type.__name__]
+
+    properties = schema["properties"]
+    for field, model in (models or {}).items():
+        model_schema = _inline_model_schema(model)
+        prop = properties[field]
+        if "anyOf" in prop:
+            prop["anyOf"] = [
+                model_schema if option.get("type") == "object" else option
+                for option in prop["anyOf"]
+            ]
+        else:
+            properties[field] = {**prop, **model_schema}
+
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": schema}
+            }
+        }
+    }
@@ -85,12 +85,7 @@ async def generate_event_generator(session: ContentSession) -> AsyncGenerator[di
         version_num = len(session.versions) + 1
         version_data = read_from_memory(session.session_id, f"versions/v{version_num}")
         if version_data:
-            version = ContentVersion(
-                version_number=version_data["version_number"],
-                content=version_data["content"],
-                generated_at=version_data.get("generated_at"),
-                feedback_applied=version_data.get("feedback_applied")
-            )
+            version = ContentVersion.model_validate(version_data)
             if not any(v.version_number == version_num for v in session.versions):
                 session.versions.append(version)
             logger.debug("Loaded version v%d into session %s", version_num, session.session_id)
@@ -229,12 +224,7 @@ async def iterate_event_generator(session: ContentSession, feedback: str) -> Asy
         version_num = len(session.versions) + 1
         version_data = read_from_memory(session.session_id, f"versions/v{version_num}")
         if version_data:
-            version = ContentVersion(
-                version_number=version_data["version_number"],
-                content=version_data["content"],
-                feedback_applied=version_data.get("feedback_applied"),
-                generated_at=version_data.get("generated_at")
-            )
+            version = ContentVersion.model_validate(version_data)
             if not any(v.version_number == version_num for v in session.versions):
                 session.versions.append(version)
             logger.debug("Loaded version v%d into session %s", version_num, session.session_id)
@@ -4,16 +4,16 @@ Publishing endpoints.
 Handles content export and publishing to various platforms.
 """
 
-from fastapi import APIRouter, HTTPException
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import HTMLResponse, Response
-from pydantic import BaseModel
 from typing import Optional, List
-from datetime import datetime
 
 from ..agents.publisher import PublisherAgent
 from ..models.content import ContentSession, SessionStatus, ContentVersion
-from ..tools.memory import read_from_memory, list_memory_keys
+from ..tools.memory import read_from_memory, get_version_count
 from .sessions import sessions
+from .dependencies import msgspec_body, msgspec_openapi
 
 router = APIRouter(prefix="/api/sessions", tags=["publish"])
 
@@ -28,22 +28,18 @@ def sync_versions_from_memory(session: ContentSession) -> None:
     if session.versions:
         return  # Already has versions
 
-    # Find version files in memory
-    version_keys = list_memory_keys(session.session_id, prefix="versions/")
+    # The versions_meta counter bounds the read loop without a directory scan
+    version_count = get_version_count(session.session_id)
 
-    for key in sorted(version_keys):
-        version_data = read_from_memory(session.session_id, key)
+    for i in range(1, version_count + 1):
+        version_data = read_from_memory(session.session_id, f"versions/v{i}")
         if version_data:
-            version = ContentVersion(
-                version_number=version_data.get("version_number", 1),
-                content=version_data.get("content", ""),
-                generated_at=datetime.fromisoformat(version_data.get("generated_at", datetime.utcnow().isoformat())),
-                feedback_applied=version_data.get("feedback_applied")
-            )
-            session.versions.append(version)
+            # Validated in one pydantic-core pass, which also parses the
+            # ISO timestamp and ignores extra keys such as "analysis"
+            session.versions.append(ContentVersion.model_validate(version_data))
 
 
-class WordPressPublishRequest(BaseModel):
+class WordPressPublishRequest(msgspec.Struct):
     """Request body for WordPress publishing."""
     site_url: str
     username: str
@@ -53,8 +49,14 @@ class WordPressPublishRequest(BaseModel):
     tags: Optional[List[int]] = None
 
 
-@router.post("/{session_id}/publish/wordpress")
-async def publish_to_wordpress(session_id: str, request: WordPressPublishRequest):
+@router.post(
+    "/{session_id}/publish/wordpress",
+    openapi_extra=msgspec_openapi(WordPressPublishRequest)
+)
+async def publish_to_wordpress(
+    session_id: str,
+    request: WordPressPublishRequest = Depends(msgspec_body(WordPressPublishRequest))
+):
     """
     Publish content to WordPress via REST API.
 
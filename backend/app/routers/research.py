@@ -163,12 +163,12 @@ async def get_research_results(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    aggregated = aggregate_research(session_id)
+    aggregated = aggregate_research(session_id, limit_sources=20)  # Limit for response size
 
     return {
         "session_id": session_id,
         "total_sources": aggregated["total_sources"],
-        "sources": aggregated["sources"][:20],  # Limit to 20 for response size
+        "sources": aggregated["sources"],
         "findings_count": len(aggregated["findings"]),
         "has_synthesis": read_from_memory(session_id, "synthesis") is not None
     }
@@ -7,8 +7,10 @@ Handles CRUD operations for content creation sessions.
 import logging
 from enum import Enum
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import uuid
@@ -16,6 +18,7 @@ import uuid
 from ..models.content import ContentSession, SessionStatus, Complexity, AgentState
 from ..models.parameters import GenerationParameters
 from ..tools.memory import save_to_memory, read_from_memory, clear_session_memory
+from .dependencies import msgspec_body, msgspec_openapi
 
 logger = logging.getLogger(__name__)
 
@@ -26,11 +29,11 @@ router = APIRouter(prefix="/api/sessions", tags=["sessions"])
 sessions: Dict[str, ContentSession] = {}
 
 
-class CreateSessionRequest(BaseModel):
+class CreateSessionRequest(msgspec.Struct):
     """Request body for creating a new session."""
     topic: str
     source_url: Optional[str] = None
-    parameters: Optional[GenerationParameters] = None
+    parameters: Optional[Dict[str, Any]] = None  # Validated as GenerationParameters
 
 
 class CreateSessionResponse(BaseModel):
@@ -42,18 +45,44 @@ class CreateSessionResponse(BaseModel):
     created_at: datetime
 
 
-@router.post("", response_model=CreateSessionResponse)
-async def create_session(request: CreateSessionRequest):
+def _dump_agents(session: ContentSession) -> List[Dict[str, Any]]:
+    """Serialize agent states, reusing the previous dump until an agent is added."""
+    return session.cached_view(
+        "agents",
+        len(session.agents),
+        lambda: [a.model_dump() for a in session.agents]
+    )
+
+
+@router.post(
+    "",
+    response_model=CreateSessionResponse,
+    openapi_extra=msgspec_openapi(
+        CreateSessionRequest,
+        models={"parameters": GenerationParameters}
+    )
+)
+async def create_session(
+    request: CreateSessionRequest = Depends(msgspec_body(CreateSessionRequest))
+):
     """
     Create a new content creation session.
 
     Returns session metadata including unique session_id.
     """
+    try:
+        parameters = GenerationParameters.model_validate(request.parameters or {})
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**error, "loc": ("body", "parameters", *error["loc"])}
+            for error in e.errors(include_url=False)
+        ])
+
     session = ContentSession(
         session_id=str(uuid.uuid4()),
         topic=request.topic,
         source_url=request.source_url,
-        parameters=request.parameters or GenerationParameters()
+        parameters=parameters
     )
     sessions[session.session_id] = session
     logger.info("Created session %s | topic: %s | source_url: %s", session.session_id, request.topic, request.source_url)
@@ -87,7 +116,17 @@ async def get_session(session_id: str):
         else:
             raise HTTPException(status_code=404, detail="Session not found")
 
-    return {
+    # updated_at is not bumped on every mutation, so fold in the fields
+    # that handlers change directly
+    token = (
+        session.updated_at,
+        session.status,
+        session.complexity,
+        len(session.research_results),
+        len(session.versions),
+        len(session.agents),
+    )
+    return session.cached_view("session", token, lambda: {
         "session_id": session.session_id,
         "topic": session.topic,
         "status": session.status.value if isinstance(session.status, Enum) else session.status,
@@ -95,10 +134,10 @@ async def get_session(session_id: str):
         "parameters": session.parameters.model_dump(),
         "research_results_count": len(session.research_results),
         "versions_count": len(session.versions),
-        "agents": [a.model_dump() for a in session.agents],
+        "agents": _dump_agents(session),
         "created_at": session.created_at.isoformat(),
         "updated_at": session.updated_at.isoformat()
-    }
+    })
 
 
 @router.delete("/{session_id}")
@@ -124,7 +163,7 @@ async def get_agent_states(session_id: str) -> List[Dict[str, Any]]:
     session = sessions.get(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    return [a.model_dump() for a in session.agents]
+    return _dump_agents(session)
 
 
 @router.get("/{session_id}/versions")
@@ -138,7 +177,7 @@ async def get_versions(session_id: str):
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    return {
+    return session.cached_view("versions", len(session.versions), lambda: {
         "session_id": session_id,
         "versions": [
             {
@@ -149,7 +188,7 @@ async def get_versions(session_id: str):
             }
             for v in session.versions
         ]
-    }
+    })
 
 
 @router.get("/{session_id}/content")
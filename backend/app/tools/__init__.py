@@ -7,15 +7,25 @@ This module provides:
 - Filesystem-based memory operations for agent coordination
 """
 
-from .search import search_web, search_broad, search_narrow
+from .search import (
+    search_web,
+    search_broad,
+    search_narrow,
+    search_web_batch,
+    search_narrow_batch,
+)
 from .scrape import scrape_url, deep_research
 from .memory import (
     save_to_memory,
+    save_many,
     read_from_memory,
     list_memory_keys,
     aggregate_research,
     clear_session_memory,
     get_session_path,
+    save_version,
+    get_version_count,
+    MemorySession,
 )
 
 __all__ = [
@@ -23,14 +33,20 @@ __all__ = [
     "search_web",
     "search_broad",
     "search_narrow",
+    "search_web_batch",
+    "search_narrow_batch",
     # Scrape tools
     "scrape_url",
     "deep_research",
     # Memory tools
     "save_to_memory",
+    "save_many",
     "read_from_memory",
     "list_memory_keys",
     "aggregate_research",
     "clear_session_memory",
     "get_session_path",
+    "save_version",
+    "get_version_count",
+    "MemorySession",
 ]
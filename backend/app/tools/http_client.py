@@ -0,0 +1,71 @@
+"""
+Shared HTTP client for the Firecrawl tools.
+
+Reusing one AsyncClient keeps TCP/TLS connections to the API alive
+between search and scrape calls instead of paying a new handshake for
+every request.
+"""
+
+import asyncio
+from typing import AsyncGenerator, Optional
+
+import httpx
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_client_closer: Optional[AsyncGenerator[None, None]] = None
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient) -> AsyncGenerator[None, None]:
+    """
+    Close a client when its event loop shuts down.
+
+    The generator is parked at its yield on the loop the client belongs to.
+    loop.shutdown_asyncgens(), which asyncio.run calls before closing the
+    loop, finalizes it there and runs the finally block while the client's
+    connections can still be closed.
+    """
+    try:
+        yield
+    finally:
+        if not client.is_closed:
+            await client.aclose()
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient, creating it on first use.
+
+    A client is tied to the event loop it was created on, so a new one is
+    created when called from a different loop (e.g. successive asyncio.run
+    calls in scripts and tests). Each client is closed when its loop shuts
+    down, so replacing it does not leak its connection pool.
+
+    Returns:
+        The shared httpx.AsyncClient
+    """
+    global _client, _client_loop, _client_closer
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        _client_loop = loop
+        # Advance the closer to its yield; the first step registers it with
+        # the running loop. The loop only holds a weak reference, so keep it
+        _client_closer = _close_on_loop_shutdown(_client)
+        try:
+            _client_closer.__anext__().send(None)
+        except StopIteration:
+            pass
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client, if one is open."""
+    global _client, _client_loop, _client_closer
+    if _client is not None and not _client.is_closed and _client_loop is asyncio.get_running_loop():
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _client_closer = None
@@ -7,14 +7,40 @@ memory space.
 """
 
 import json
+import logging
+import os
 import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from ..config import settings
+from . import memory_sqlite, memory_uring
+
+logger = logging.getLogger(__name__)
 
 MEMORY_BASE_PATH = settings.memory_base_path
+USE_SQLITE = settings.memory_backend in ("sqlite", "memory")
+
+# Minimum number of research files before the io_uring batch path is used
+URING_BATCH_THRESHOLD = 8
+
+# Aggregated research keyed by (session_id, limit_sources), validated
+# against the research/ directory mtime and evicted least-recently-used
+AGGREGATE_CACHE_SIZE = 64
+_agg_cache: "OrderedDict[Tuple[str, Optional[int]], Tuple[int, Dict[str, Any]]]" = OrderedDict()
+
+
+def _invalidate_aggregate_cache(session_id: str) -> None:
+    """Drop every cached aggregate for a session."""
+    for cache_key in [k for k in _agg_cache if k[0] == session_id]:
+        del _agg_cache[cache_key]
 
 
 def get_session_path(session_id: str) -> Path:
@@ -32,6 +58,42 @@ def get_session_path(session_id: str) -> Path:
     return path
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    return json.dumps(obj, indent=2, default=str).encode()
+
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _read_json_file(path: str) -> Any:
+    """
+    Read and decode a JSON file using a single open/fstat/read sequence.
+
+    Args:
+        path: Filesystem path of the JSON file
+
+    Returns:
+        The decoded JSON document
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        buf = os.read(fd, size)
+    finally:
+        os.close(fd)
+    return _loads(buf)
+
+
 def save_to_memory(session_id: str, key: str, data: Any) -> str:
     """
     Save data to filesystem memory.
@@ -49,6 +111,9 @@ def save_to_memory(session_id: str, key: str, data: Any) -> str:
         - Automatically adds metadata (timestamp, key)
         - Uses JSON serialization with datetime support
     """
+    if USE_SQLITE:
+        return memory_sqlite.save(session_id, key, data)
+
     session_path = get_session_path(session_id)
     file_path = session_path / f"{key}.json"
     file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -60,12 +125,62 @@ def save_to_memory(session_id: str, key: str, data: Any) -> str:
         "key": key
     }
 
-    with open(file_path, 'w') as f:
-        json.dump(payload, f, indent=2, default=str)
+    with open(file_path, 'wb') as f:
+        f.write(_dumps(payload))
+
+    # Overwriting a file does not change the directory mtime
+    if key.startswith("research/"):
+        _invalidate_aggregate_cache(session_id)
 
     return str(file_path)
 
 
+def save_many(session_id: str, entries: Dict[str, Any]) -> List[str]:
+    """
+    Save several memory entries in one call.
+
+    Each key is still stored in its own file so that reads, key listing and
+    aggregation work unchanged, but the session lookup, timestamp, directory
+    creation and cache invalidation are done once for the whole batch.
+
+    Args:
+        session_id: Session identifier
+        entries: Mapping of memory key to data (must be JSON-serializable)
+
+    Returns:
+        File paths where the entries were saved, in mapping order
+    """
+    if USE_SQLITE:
+        return memory_sqlite.save_many(session_id, entries)
+
+    session_path = get_session_path(session_id)
+    saved_at = datetime.utcnow().isoformat()
+    created_dirs = set()
+    paths = []
+
+    for key, data in entries.items():
+        file_path = session_path / f"{key}.json"
+        if file_path.parent not in created_dirs:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            created_dirs.add(file_path.parent)
+
+        payload = {
+            "data": data,
+            "saved_at": saved_at,
+            "key": key
+        }
+
+        with open(file_path, 'wb') as f:
+            f.write(_dumps(payload))
+
+        paths.append(str(file_path))
+
+    if any(key.startswith("research/") for key in entries):
+        _invalidate_aggregate_cache(session_id)
+
+    return paths
+
+
 def read_from_memory(session_id: str, key: str) -> Optional[Any]:
     """
     Read data from filesystem memory.
@@ -77,14 +192,15 @@ def read_from_memory(session_id: str, key: str) -> Optional[Any]:
     Returns:
         The stored data, or None if key doesn't exist
     """
-    session_path = get_session_path(session_id)
-    file_path = session_path / f"{key}.json"
+    if USE_SQLITE:
+        return memory_sqlite.read(session_id, key)
 
-    if not file_path.exists():
-        return None
+    file_path = os.path.join(get_session_path(session_id), f"{key}.json")
 
-    with open(file_path, 'r') as f:
-        payload = json.load(f)
+    try:
+        payload = _read_json_file(file_path)
+    except FileNotFoundError:
+        return None
 
     return payload.get("data")
 
@@ -100,10 +216,33 @@ def list_memory_keys(session_id: str, prefix: str = "") -> List[str]:
     Returns:
         Sorted list of memory keys
     """
+    if USE_SQLITE:
+        return memory_sqlite.list_keys(session_id, prefix)
+
     session_path = get_session_path(session_id)
     if not session_path.exists():
         return []
 
+    # Fast path: a flat directory can be listed with a single scandir
+    sub_dir = prefix.rpartition("/")[0]
+    scan_path = os.path.join(session_path, sub_dir) if sub_dir else str(session_path)
+    keys = []
+    try:
+        with os.scandir(scan_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    break
+                if entry.name.endswith(".json"):
+                    name = entry.name[:-5]
+                    key = f"{sub_dir}/{name}" if sub_dir else name
+                    if key.startswith(prefix):
+                        keys.append(key)
+            else:
+                return sorted(keys)
+    except FileNotFoundError:
+        return []
+
+    # Nested directories exist - fall back to a recursive walk
     keys = []
     for file_path in session_path.rglob("*.json"):
         key = str(file_path.relative_to(session_path)).replace(".json", "")
@@ -113,7 +252,53 @@ def list_memory_keys(session_id: str, prefix: str = "") -> List[str]:
     return sorted(keys)
 
 
-def aggregate_research(session_id: str) -> Dict[str, Any]:
+def save_version(session_id: str, version_num: int, data: Any) -> str:
+    """
+    Save a content version and record it in the versions_meta counter.
+
+    Args:
+        session_id: Session identifier
+        version_num: Version number (stored under "versions/v{version_num}")
+        data: Version data to save (must be JSON-serializable)
+
+    Returns:
+        File path where the version was saved
+    """
+    path = save_to_memory(session_id, f"versions/v{version_num}", data)
+    if version_num > get_version_count(session_id):
+        save_to_memory(session_id, "versions_meta", {"count": version_num})
+    return path
+
+
+def get_version_count(session_id: str) -> int:
+    """
+    Get the highest saved version number for a session.
+
+    Reads the versions_meta counter. Sessions written before the counter
+    existed are scanned once and the counter is backfilled.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        Highest version number, or 0 if no versions exist
+    """
+    meta = read_from_memory(session_id, "versions_meta")
+    if meta is not None:
+        return meta.get("count", 0)
+
+    count = 0
+    for key in list_memory_keys(session_id, prefix="versions/v"):
+        number = key[len("versions/v"):]
+        if number.isdigit():
+            count = max(count, int(number))
+
+    if count:
+        save_to_memory(session_id, "versions_meta", {"count": count})
+    return count
+
+
+def aggregate_research(session_id: str, limit_sources: Optional[int] = None) -> Dict[str, Any]:
     """
     Aggregate all research findings from subagents.
 
@@ -122,32 +307,90 @@ def aggregate_research(session_id: str) -> Dict[str, Any]:
 
     Args:
         session_id: Session identifier
+        limit_sources: Optional cap on the number of sources collected;
+            total_sources still counts every source
 
     Returns:
         Dictionary containing:
             - sources: list - All sources from all research agents
             - findings: list - All findings and summaries
             - total_sources: int - Total number of unique sources
+
+    Notes:
+        - Results are cached until the research/ directory mtime changes
+          or a research key is saved in this process
+        - The returned dictionary is shared with the cache; do not mutate it
     """
-    research_keys = list_memory_keys(session_id, prefix="research/")
+    if USE_SQLITE:
+        return _aggregate_research_uncached(session_id, limit_sources)
+
+    research_dir = os.path.join(get_session_path(session_id), "research")
+    try:
+        mtime = os.stat(research_dir).st_mtime_ns
+    except FileNotFoundError:
+        mtime = 0
+
+    cache_key = (session_id, limit_sources)
+    cached = _agg_cache.get(cache_key)
+    if cached and cached[0] == mtime:
+        _agg_cache.move_to_end(cache_key)
+        return cached[1]
+
+    aggregated = _aggregate_research_uncached(session_id, limit_sources)
+
+    _agg_cache[cache_key] = (mtime, aggregated)
+    _agg_cache.move_to_end(cache_key)
+    if len(_agg_cache) > AGGREGATE_CACHE_SIZE:
+        _agg_cache.popitem(last=False)
 
+    return aggregated
+
+
+def _aggregate_research_uncached(session_id: str, limit_sources: Optional[int]) -> Dict[str, Any]:
+    """Read every research entry and build the aggregate (see aggregate_research)."""
     aggregated = {
         "sources": [],
         "findings": [],
         "total_sources": 0
     }
 
-    for key in research_keys:
-        data = read_from_memory(session_id, key)
+    if USE_SQLITE:
+        entries = memory_sqlite.iter_research(session_id)
+    else:
+        research_keys = list_memory_keys(session_id, prefix="research/")
+        entries = None
+        if (
+            settings.use_io_uring
+            and len(research_keys) >= URING_BATCH_THRESHOLD
+            and memory_uring.is_available()
+        ):
+            try:
+                raw = memory_uring.batch_read(session_id, research_keys)
+                entries = [_loads(raw[key]).get("data") for key in research_keys if key in raw]
+            except Exception as e:
+                # Any io_uring failure (or a short read leaving invalid JSON)
+                # falls back to reading each file normally
+                logger.warning(f"io_uring batch read failed, falling back to per-file reads: {e}")
+        if entries is None:
+            entries = (read_from_memory(session_id, key) for key in research_keys)
+
+    sources = aggregated["sources"]
+    total_sources = 0
+
+    for data in entries:
         if data:
             if "sources" in data:
-                aggregated["sources"].extend(data["sources"])
+                total_sources += len(data["sources"])
+                if limit_sources is None:
+                    sources.extend(data["sources"])
+                elif len(sources) < limit_sources:
+                    sources.extend(data["sources"][:limit_sources - len(sources)])
             if "findings" in data:
                 aggregated["findings"].append(data["findings"])
             if "summary" in data:
                 aggregated["findings"].append(data["summary"])
 
-    aggregated["total_sources"] = len(aggregated["sources"])
+    aggregated["total_sources"] = total_sources
     return aggregated
 
 
@@ -161,8 +404,105 @@ def clear_session_memory(session_id: str) -> bool:
     Returns:
         True if memory was deleted, False if session didn't exist
     """
+    if USE_SQLITE:
+        return memory_sqlite.clear(session_id)
+
+    _invalidate_aggregate_cache(session_id)
+
     session_path = get_session_path(session_id)
     if session_path.exists():
         shutil.rmtree(session_path)
         return True
     return False
+
+
+class MemorySession:
+    """
+    Session-scoped view of memory that batches writes.
+
+    Saves are buffered and written together with ``save_many`` when the
+    ``with`` block exits cleanly (or on ``flush()``), so a run of writes
+    costs one batched save instead of one per key. Reads and key listings
+    see buffered entries. If the block raises, buffered writes are dropped.
+
+    Example:
+        with MemorySession(session_id) as memory:
+            memory.save("notes/plan", plan)
+            memory.save("notes/status", {"status": "ready"})
+            plan = memory.read("notes/plan")
+    """
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        self._pending: Dict[str, Any] = {}
+
+    def __enter__(self) -> "MemorySession":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._pending.clear()
+
+    def save(self, key: str, data: Any) -> None:
+        """
+        Buffer an entry for the next flush.
+
+        Args:
+            key: Memory key
+            data: Data to save (must be JSON-serializable)
+        """
+        self._pending[key] = data
+
+    def read(self, key: str) -> Optional[Any]:
+        """
+        Read an entry, preferring a buffered write over stored data.
+
+        Args:
+            key: Memory key
+
+        Returns:
+            The data, or None if the key doesn't exist
+        """
+        if key in self._pending:
+            return self._pending[key]
+        return read_from_memory(self.session_id, key)
+
+    def keys(self, prefix: str = "") -> List[str]:
+        """
+        List stored and buffered keys.
+
+        Args:
+            prefix: Optional key prefix filter
+
+        Returns:
+            Sorted list of memory keys
+        """
+        keys = set(list_memory_keys(self.session_id, prefix))
+        keys.update(key for key in self._pending if key.startswith(prefix))
+        return sorted(keys)
+
+    def flush(self) -> List[str]:
+        """
+        Write all buffered entries in one batch.
+
+        Returns:
+            Storage locations of the written entries
+        """
+        if not self._pending:
+            return []
+        paths = save_many(self.session_id, self._pending)
+        self._pending.clear()
+        return paths
+
+    def clear(self) -> bool:
+        """
+        Drop buffered entries and delete the session's stored memory.
+
+        Returns:
+            True if anything was discarded or deleted
+        """
+        had_pending = bool(self._pending)
+        self._pending.clear()
+        return clear_session_memory(self.session_id) or had_pending
@@ -0,0 +1,219 @@
+"""
+SQLite backend for agent memory.
+
+Stores every session's memory entries in a single WAL-mode database instead
+of one JSON file per key. Lookups hit the (session_id, key) primary key,
+prefix listings are index range scans, and batched saves share one
+transaction. Selected with ``MEMORY_BACKEND=sqlite``; the public API lives
+in ``memory.py``, which dispatches here.
+
+``MEMORY_BACKEND=memory`` uses the same schema in a process-wide in-memory
+database, so nothing touches disk. Entries last only as long as the
+process, which makes it suitable for tests and local experiments.
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import settings
+
+DB_PATH = settings.memory_base_path / "memory.db"
+IN_MEMORY = settings.memory_backend == "memory"
+
+# Named shared-cache database, so every thread's connection sees the same data
+IN_MEMORY_URI = "file:cce_memory?mode=memory&cache=shared"
+
+# sqlite3 connections may not be shared across threads
+_local = threading.local()
+
+# The in-memory database is discarded once its last connection closes, so
+# hold one open for the life of the process
+_memory_anchor: Optional[sqlite3.Connection] = None
+
+
+def _open(in_memory: bool) -> sqlite3.Connection:
+    """Open a connection to the configured database."""
+    global _memory_anchor
+    if in_memory:
+        if _memory_anchor is None:
+            _memory_anchor = sqlite3.connect(IN_MEMORY_URI, uri=True, check_same_thread=False)
+        return sqlite3.connect(IN_MEMORY_URI, uri=True)
+
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_PATH)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _connection() -> sqlite3.Connection:
+    """Get this thread's database connection, creating the schema on first use."""
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(IN_MEMORY)
+    if conn is None:
+        conn = _open(IN_MEMORY)
+        conn.execute(
+            """CREATE TABLE IF NOT EXISTS memory (
+                session_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                saved_at TEXT NOT NULL,
+                PRIMARY KEY (session_id, key)
+            ) WITHOUT ROWID"""
+        )
+        conns[IN_MEMORY] = conn
+    return conn
+
+
+def _prefix_bounds(prefix: str) -> tuple:
+    """Turn a key prefix into a [low, high) range usable by the primary key index."""
+    return prefix, prefix + "\U0010ffff"
+
+
+def _location(session_id: str, key: str) -> str:
+    """Describe where an entry is stored, mirroring the file path returned by the filesystem backend."""
+    return f"{':memory:' if IN_MEMORY else DB_PATH}#{session_id}/{key}"
+
+
+def save(session_id: str, key: str, data: Any) -> str:
+    """
+    Insert or replace a single memory entry.
+
+    Args:
+        session_id: Session identifier
+        key: Memory key
+        data: Data to save (must be JSON-serializable)
+
+    Returns:
+        Storage location of the entry
+    """
+    return save_many(session_id, {key: data})[0]
+
+
+def save_many(session_id: str, entries: Dict[str, Any]) -> List[str]:
+    """
+    Insert or replace several memory entries in one transaction.
+
+    Args:
+        session_id: Session identifier
+        entries: Mapping of memory key to data (must be JSON-serializable)
+
+    Returns:
+        Storage locations of the entries, in mapping order
+    """
+    saved_at = datetime.utcnow().isoformat()
+    rows = [
+        (session_id, key, json.dumps(data, default=str), saved_at)
+        for key, data in entries.items()
+    ]
+    conn = _connection()
+    with conn:
+        conn.executemany("INSERT OR REPLACE INTO memory VALUES (?, ?, ?, ?)", rows)
+    return [_location(session_id, key) for key in entries]
+
+
+def read(session_id: str, key: str) -> Optional[Any]:
+    """
+    Read a single memory entry.
+
+    Args:
+        session_id: Session identifier
+        key: Memory key
+
+    Returns:
+        The stored data, or None if the key doesn't exist
+    """
+    row = _connection().execute(
+        "SELECT value FROM memory WHERE session_id = ? AND key = ?",
+        (session_id, key)
+    ).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def list_keys(session_id: str, prefix: str = "") -> List[str]:
+    """
+    List memory keys for a session.
+
+    Args:
+        session_id: Session identifier
+        prefix: Optional key prefix filter
+
+    Returns:
+        Sorted list of memory keys
+    """
+    low, high = _prefix_bounds(prefix)
+    rows = _connection().execute(
+        "SELECT key FROM memory WHERE session_id = ? AND key >= ? AND key < ? ORDER BY key",
+        (session_id, low, high)
+    ).fetchall()
+    return [row[0] for row in rows]
+
+
+def _decode_json_value(kind: Optional[str], value: Any) -> Any:
+    """
+    Turn a json_type()/json_extract() pair back into the Python value json.loads would give.
+
+    json_extract returns arrays and objects as JSON text and booleans as
+    0/1, so those are decoded from their JSON type.
+    """
+    if kind in ("array", "object"):
+        return json.loads(value)
+    if kind in ("true", "false"):
+        return kind == "true"
+    return value
+
+
+def iter_research(session_id: str) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the aggregation-relevant fields of every research entry.
+
+    Uses JSON1 extraction so only sources, findings and summary leave the
+    database rather than whole payloads. Values decode to the same Python
+    types as the filesystem backend's entries.
+
+    Args:
+        session_id: Session identifier
+
+    Yields:
+        Dictionaries containing whichever of sources/findings/summary are present
+    """
+    low, high = _prefix_bounds("research/")
+    rows = _connection().execute(
+        """SELECT json_type(value, '$.sources'), json_extract(value, '$.sources'),
+                  json_type(value, '$.findings'), json_extract(value, '$.findings'),
+                  json_type(value, '$.summary'), json_extract(value, '$.summary')
+           FROM memory
+           WHERE session_id = ? AND key >= ? AND key < ?
+           ORDER BY key""",
+        (session_id, low, high)
+    )
+    fields = ("sources", "findings", "summary")
+    for row in rows:
+        entry = {}
+        for i, field in enumerate(fields):
+            kind = row[2 * i]
+            # json_type is NULL only when the key is absent
+            if kind is not None:
+                entry[field] = _decode_json_value(kind, row[2 * i + 1])
+        yield entry
+
+
+def clear(session_id: str) -> bool:
+    """
+    Delete all memory entries for a session.
+
+    Args:
+        session_id: Session identifier
+
+    Returns:
+        True if any entries were deleted
+    """
+    conn = _connection()
+    with conn:
+        cursor = conn.execute("DELETE FROM memory WHERE session_id = ?", (session_id,))
+    return cursor.rowcount > 0
@@ -0,0 +1,129 @@
+"""
+Optional io_uring batch reader for filesystem memory.
+
+Submits the opens and reads for many small memory files as batches on a
+single io_uring instance instead of issuing one blocking open/read/close
+sequence per file. Requires the ``liburing`` Python bindings and a Linux
+kernel with io_uring support; callers should check ``is_available()`` and
+fall back to the regular POSIX path otherwise.
+"""
+
+import errno
+import os
+from typing import Dict, List
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+from ..config import settings
+
+
+def is_available() -> bool:
+    """
+    Check whether the io_uring bindings can be used.
+
+    Returns:
+        True if liburing was imported successfully
+    """
+    return liburing is not None
+
+
+def _drain(ring, cqe, count: int) -> Dict[int, int]:
+    """
+    Wait for `count` completions and map each user_data index to its result.
+
+    Args:
+        ring: The io_uring instance
+        cqe: Reusable completion queue entry
+        count: Number of completions to collect
+
+    Returns:
+        Dictionary mapping submission index to the raw (possibly negative) result
+    """
+    results = {}
+    for _ in range(count):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        results[cqe.user_data] = cqe.res
+        liburing.io_uring_cqe_seen(ring, cqe)
+    return results
+
+
+def batch_read(session_id: str, keys: List[str]) -> Dict[str, bytes]:
+    """
+    Read the raw JSON payloads for several memory keys in two io_uring batches.
+
+    The first batch opens every file, the second reads them all. Keys whose
+    files do not exist are omitted from the result, matching the
+    ``read_from_memory`` behaviour of returning None for missing keys.
+
+    Args:
+        session_id: Session identifier
+        keys: Memory keys to read (e.g., "research/agent_123")
+
+    Returns:
+        Dictionary mapping each found key to the raw bytes of its file
+
+    Raises:
+        RuntimeError: If liburing is not installed
+        OSError: If an open or read fails for a reason other than a missing file
+    """
+    if liburing is None:
+        raise RuntimeError("liburing is not installed")
+    if not keys:
+        return {}
+
+    session_path = settings.memory_base_path / session_id
+    ring = liburing.io_uring()
+    cqe = liburing.io_uring_cqe()
+    liburing.io_uring_queue_init(len(keys), ring, 0)
+    fds: Dict[int, int] = {}
+
+    try:
+        # Batch 1: open every file
+        for i, key in enumerate(keys):
+            sqe = liburing.io_uring_get_sqe(ring)
+            # The Python binding orders these as (sqe, path, flags, mode, dir_fd),
+            # unlike the C API which takes dir_fd first
+            liburing.io_uring_prep_openat(
+                sqe,
+                os.fsencode(session_path / f"{key}.json"),
+                os.O_RDONLY,
+                0,
+                liburing.AT_FDCWD
+            )
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        liburing.io_uring_submit_and_wait(ring, len(keys))
+
+        for i, res in _drain(ring, cqe, len(keys)).items():
+            if res >= 0:
+                fds[i] = res
+            elif -res != errno.ENOENT:
+                raise OSError(-res, os.strerror(-res), keys[i])
+
+        if not fds:
+            return {}
+
+        # Batch 2: read every opened file in full
+        buffers = {}
+        for i, fd in fds.items():
+            size = os.fstat(fd).st_size
+            buffers[i] = bytearray(size)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_read(sqe, fd, buffers[i], size, 0)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        liburing.io_uring_submit_and_wait(ring, len(fds))
+
+        payloads = {}
+        for i, res in _drain(ring, cqe, len(fds)).items():
+            if res < 0:
+                raise OSError(-res, os.strerror(-res), keys[i])
+            payloads[keys[i]] = bytes(buffers[i][:res])
+
+        return payloads
+
+    finally:
+        for fd in fds.values():
+            os.close(fd)
+        liburing.io_uring_queue_exit(ring)
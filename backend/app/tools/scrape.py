@@ -5,14 +5,102 @@ Provides functions for scraping individual URLs and conducting
 deep research on topics.
 """
 
-import httpx
-from typing import Dict, Any, List
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..config import settings
+from .http_client import get_client
 
 FIRECRAWL_BASE_URL = "https://api.firecrawl.dev/v1"
 
+SCRAPE_CACHE_PATH = settings.memory_base_path / "_scrape_cache"
 
+
+def _read_cache_entry(cache_file: Path, ttl: int) -> Tuple[bool, Any]:
+    """
+    Read a cache entry if it exists and is younger than `ttl` seconds.
+
+    Returns:
+        Tuple of (hit, cached result)
+    """
+    try:
+        with open(cache_file, 'r') as f:
+            entry = json.load(f)
+        if time.time() - entry["cached_at"] < ttl:
+            return True, entry["result"]
+    except (FileNotFoundError, ValueError, KeyError):
+        pass
+    return False, None
+
+
+def _write_cache_entry(cache_file: Path, result: Any) -> None:
+    """Write a cache entry atomically, so concurrent readers never see a partial file."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"cached_at": time.time(), "result": result}, f, default=str)
+        os.replace(tmp_path, cache_file)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def async_disk_cached(ttl: Optional[int] = None):
+    """
+    Cache an async function's JSON-serializable results on disk.
+
+    Results are keyed by the function name and its bound arguments (defaults
+    applied), so repeated calls with the same parameters skip the network
+    entirely until the entry is older than the TTL. Exceptions are not
+    cached. Cache files are read and written on a worker thread so the event
+    loop is never blocked on disk.
+
+    Args:
+        ttl: Time-to-live for cache entries in seconds; defaults to
+            settings.scrape_cache_ttl, read on every call. A TTL of 0 or
+            less disables the cache.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            entry_ttl = settings.scrape_cache_ttl if ttl is None else ttl
+            if entry_ttl <= 0:
+                return await func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key_source = json.dumps(
+                [func.__qualname__, bound.arguments],
+                sort_keys=True,
+                default=str
+            )
+            cache_file = SCRAPE_CACHE_PATH / f"{hashlib.sha256(key_source.encode()).hexdigest()}.json"
+
+            hit, cached = await asyncio.to_thread(_read_cache_entry, cache_file, entry_ttl)
+            if hit:
+                return cached
+
+            result = await func(*args, **kwargs)
+            await asyncio.to_thread(_write_cache_entry, cache_file, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@async_disk_cached()
 async def scrape_url(
     url: str,
     formats: List[str] = None,
@@ -35,6 +123,9 @@ async def scrape_url(
     Raises:
         httpx.HTTPStatusError: If the API request fails
         ValueError: If Firecrawl API key is not configured
+
+    Note:
+        Results are cached on disk for 24 hours per URL and parameters.
     """
     if formats is None:
         formats = ["markdown"]
@@ -42,22 +133,23 @@ async def scrape_url(
     if not settings.firecrawl_api_key:
         raise ValueError("Firecrawl API key not configured in settings")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FIRECRAWL_BASE_URL}/scrape",
-            headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
-            json={
-                "url": url,
-                "formats": formats,
-                "onlyMainContent": only_main_content
-            },
-            timeout=60.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {})
-
-
+    client = get_client()
+    response = await client.post(
+        f"{FIRECRAWL_BASE_URL}/scrape",
+        headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
+        json={
+            "url": url,
+            "formats": formats,
+            "onlyMainContent": only_main_content
+        },
+        timeout=60.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data.get("data", {})
+
+
+@async_disk_cached()
 async def deep_research(
     topic: str,
     max_depth: int = 3,
@@ -86,21 +178,22 @@ async def deep_research(
 
     Note:
         Deep research can take several minutes depending on the topic complexity.
+        Results are cached on disk for 24 hours per topic and parameters.
     """
     if not settings.firecrawl_api_key:
         raise ValueError("Firecrawl API key not configured in settings")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FIRECRAWL_BASE_URL}/deep-research",
-            headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
-            json={
-                "query": topic,
-                "maxDepth": max_depth,
-                "maxUrls": max_urls
-            },
-            timeout=300.0  # Deep research can take a while
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", {})
+    client = get_client()
+    response = await client.post(
+        f"{FIRECRAWL_BASE_URL}/deep-research",
+        headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
+        json={
+            "query": topic,
+            "maxDepth": max_depth,
+            "maxUrls": max_urls
+        },
+        timeout=300.0  # Deep research can take a while
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data.get("data", {})
@@ -5,13 +5,17 @@ Provides functions for searching the web and retrieving search results
 with content extraction capabilities.
 """
 
-import httpx
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Union
 
 from ..config import settings
+from .http_client import get_client
 
 FIRECRAWL_BASE_URL = "https://api.firecrawl.dev/v1"
 
+# Upper bound on concurrent Firecrawl searches issued by the batch helpers
+MAX_CONCURRENT_SEARCHES = 8
+
 
 async def search_web(
     query: str,
@@ -38,25 +42,25 @@ async def search_web(
     if not settings.firecrawl_api_key:
         raise ValueError("Firecrawl API key not configured in settings")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{FIRECRAWL_BASE_URL}/search",
-            headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
-            json={
-                "query": query,
-                "limit": limit,
-                "lang": lang,
-                "country": country,
-                "scrapeOptions": {
-                    "formats": ["markdown"],
-                    "onlyMainContent": True
-                }
-            },
-            timeout=60.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("data", [])
+    client = get_client()
+    response = await client.post(
+        f"{FIRECRAWL_BASE_URL}/search",
+        headers={"Authorization": f"Bearer {settings.firecrawl_api_key}"},
+        json={
+            "query": query,
+            "limit": limit,
+            "lang": lang,
+            "country": country,
+            "scrapeOptions": {
+                "formats": ["markdown"],
+                "onlyMainContent": True
+            }
+        },
+        timeout=60.0
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data.get("data", [])
 
 
 async def search_broad(topic: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -86,3 +90,53 @@ async def search_narrow(topic: str, aspect: str, limit: int = 3) -> List[Dict[st
         List of search results focused on the specific aspect
     """
     return await search_web(f"{topic} {aspect}", limit=limit)
+
+
+async def search_web_batch(
+    queries: List[str],
+    limit: int = 5
+) -> List[Union[List[Dict[str, Any]], BaseException]]:
+    """
+    Run several web searches concurrently.
+
+    At most MAX_CONCURRENT_SEARCHES requests are in flight at once so the
+    network latency of each query overlaps without flooding Firecrawl.
+
+    Args:
+        queries: Search query strings
+        limit: Maximum number of results per query (default: 5)
+
+    Returns:
+        One entry per query, in order: either the list of search results or
+        the exception raised for that query
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def run_one(query: str) -> List[Dict[str, Any]]:
+        async with semaphore:
+            return await search_web(query, limit=limit)
+
+    return await asyncio.gather(
+        *[run_one(query) for query in queries],
+        return_exceptions=True
+    )
+
+
+async def search_narrow_batch(
+    topic: str,
+    aspects: List[str],
+    limit: int = 3
+) -> List[Union[List[Dict[str, Any]], BaseException]]:
+    """
+    Narrow search on several aspects of a topic concurrently.
+
+    Args:
+        topic: The main topic
+        aspects: Specific aspects to focus on
+        limit: Maximum number of results per aspect (default: 3)
+
+    Returns:
+        One entry per aspect, in order: either the list of search results or
+        the exception raised for that aspect
+    """
+    return await search_web_batch([f"{topic} {aspect}" for aspect in aspects], limit=limit)
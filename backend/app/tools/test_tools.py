@@ -6,12 +6,15 @@ Requires a valid FIRECRAWL_API_KEY in the .env file.
 """
 
 import asyncio
+import sys
 from typing import Dict, Any
 
 from .search import search_web, search_broad, search_narrow
 from .scrape import scrape_url, deep_research
+from .http_client import close_client
 from .memory import (
     save_to_memory,
+    save_many,
     read_from_memory,
     list_memory_keys,
     aggregate_research,
@@ -23,30 +26,34 @@ async def test_search_tools():
     """Test all search functions."""
     print("\n=== Testing Search Tools ===\n")
 
-    try:
-        # Test basic search
-        print("1. Testing search_web...")
-        results = await search_web("Python programming", limit=2)
-        print(f"   Found {len(results)} results")
-        if results:
-            print(f"   First result: {results[0].get('url', 'N/A')}")
-
-        # Test broad search
-        print("\n2. Testing search_broad...")
-        results = await search_broad("artificial intelligence", limit=2)
-        print(f"   Found {len(results)} results")
-
-        # Test narrow search
-        print("\n3. Testing search_narrow...")
-        results = await search_narrow("AI", "ethics", limit=2)
-        print(f"   Found {len(results)} results")
-
-        print("\n✓ All search tests passed!")
-        return True
+    # The three searches are independent, so run them concurrently
+    cases = [
+        ("search_web", search_web("Python programming", limit=2)),
+        ("search_broad", search_broad("artificial intelligence", limit=2)),
+        ("search_narrow", search_narrow("AI", "ethics", limit=2)),
+    ]
+    results = await asyncio.gather(
+        *[coro for _, coro in cases],
+        return_exceptions=True
+    )
 
-    except Exception as e:
-        print(f"\n✗ Search test failed: {e}")
-        return False
+    all_passed = True
+    for i, ((name, _), result) in enumerate(zip(cases, results), 1):
+        print(f"{i}. Testing {name}...")
+        if isinstance(result, BaseException):
+            print(f"   ✗ Failed: {result}\n")
+            all_passed = False
+            continue
+        print(f"   Found {len(result)} results")
+        if name == "search_web" and result:
+            print(f"   First result: {result[0].get('url', 'N/A')}")
+        print()
+
+    if all_passed:
+        print("✓ All search tests passed!")
+    else:
+        print("✗ Search test failed")
+    return all_passed
 
 
 async def test_scrape_tools():
@@ -75,64 +82,72 @@ async def test_scrape_tools():
 
 def test_memory_tools():
     """Test all memory functions."""
-    print("\n=== Testing Memory Tools ===\n")
+    # Output is collected and written once at the end, which also keeps it
+    # from interleaving with the search/scrape suites running alongside
+    log = ["\n=== Testing Memory Tools ===\n"]
 
     try:
         session_id = "test_session_123"
 
         # Test save
-        print("1. Testing save_to_memory...")
+        log.append("1. Testing save_to_memory...")
         test_data = {
             "sources": ["https://example.com/1", "https://example.com/2"],
             "findings": "This is a test finding",
             "summary": "Test summary"
         }
         path = save_to_memory(session_id, "research/agent_1", test_data)
-        print(f"   Saved to: {path}")
+        log.append(f"   Saved to: {path}")
 
         # Test read
-        print("\n2. Testing read_from_memory...")
+        log.append("\n2. Testing read_from_memory...")
         retrieved_data = read_from_memory(session_id, "research/agent_1")
-        print(f"   Retrieved data: {retrieved_data is not None}")
+        log.append(f"   Retrieved data: {retrieved_data is not None}")
         assert retrieved_data == test_data, "Data mismatch!"
 
         # Test save another entry
-        print("\n3. Saving another entry...")
-        save_to_memory(session_id, "research/agent_2", {
-            "sources": ["https://example.com/3"],
-            "findings": "Another finding"
+        log.append("\n3. Saving more entries with save_many...")
+        paths = save_many(session_id, {
+            "research/agent_2": {
+                "sources": ["https://example.com/3"],
+                "findings": "Another finding"
+            },
+            "notes/agent_2": {"status": "complete"}
         })
+        log.append(f"   Saved {len(paths)} entries")
 
         # Test list keys
-        print("\n4. Testing list_memory_keys...")
+        log.append("\n4. Testing list_memory_keys...")
         all_keys = list_memory_keys(session_id)
-        print(f"   All keys: {all_keys}")
+        log.append(f"   All keys: {all_keys}")
         research_keys = list_memory_keys(session_id, prefix="research/")
-        print(f"   Research keys: {research_keys}")
+        log.append(f"   Research keys: {research_keys}")
         assert len(research_keys) == 2, "Should have 2 research keys"
 
         # Test aggregate
-        print("\n5. Testing aggregate_research...")
+        log.append("\n5. Testing aggregate_research...")
         aggregated = aggregate_research(session_id)
-        print(f"   Total sources: {aggregated['total_sources']}")
-        print(f"   Number of findings: {len(aggregated['findings'])}")
+        log.append(f"   Total sources: {aggregated['total_sources']}")
+        log.append(f"   Number of findings: {len(aggregated['findings'])}")
         assert aggregated['total_sources'] == 3, "Should have 3 total sources"
 
         # Test clear
-        print("\n6. Testing clear_session_memory...")
+        log.append("\n6. Testing clear_session_memory...")
         cleared = clear_session_memory(session_id)
-        print(f"   Session cleared: {cleared}")
+        log.append(f"   Session cleared: {cleared}")
         assert cleared, "Session should have been cleared"
 
         # Verify cleared
         keys_after_clear = list_memory_keys(session_id)
-        print(f"   Keys after clear: {keys_after_clear}")
+        log.append(f"   Keys after clear: {keys_after_clear}")
         assert len(keys_after_clear) == 0, "Should have no keys after clear"
 
-        print("\n✓ All memory tests passed!")
+        log.append("\n✓ All memory tests passed!")
+        sys.stdout.write("\n".join(log) + "\n")
         return True
 
     except Exception as e:
+        sys.stdout.write("\n".join(log) + "\n")
         print(f"\n✗ Memory test failed: {e}")
         # Cleanup on error
         try:
@@ -148,16 +163,30 @@ async def run_all_tests():
     print("TOOLS LAYER TEST SUITE")
     print("=" * 60)
 
-    results = []
-
-    # Test memory (synchronous)
-    results.append(("Memory Tools", test_memory_tools()))
-
-    # Test search (async)
-    results.append(("Search Tools", await test_search_tools()))
-
-    # Test scrape (async)
-    results.append(("Scrape Tools", await test_scrape_tools()))
+    # The suites touch disjoint resources (filesystem, Firecrawl search,
+    # Firecrawl scrape), so run them concurrently; memory is synchronous
+    # and runs in a worker thread
+    if hasattr(asyncio, "TaskGroup"):
+        async with asyncio.TaskGroup() as tg:
+            memory_task = tg.create_task(asyncio.to_thread(test_memory_tools))
+            search_task = tg.create_task(test_search_tools())
+            scrape_task = tg.create_task(test_scrape_tools())
+        memory_passed = memory_task.result()
+        search_passed = search_task.result()
+        scrape_passed = scrape_task.result()
+    else:
+        # Python 3.10
+        memory_passed, search_passed, scrape_passed = await asyncio.gather(
+            asyncio.to_thread(test_memory_tools),
+            test_search_tools(),
+            test_scrape_tools(),
+        )
+
+    results = [
+        ("Memory Tools", memory_passed),
+        ("Search Tools", search_passed),
+        ("Scrape Tools", scrape_passed),
+    ]
 
     # Summary
     print("\n" + "=" * 60)
@@ -181,6 +210,14 @@ async def run_all_tests():
     return all_passed
 
 
+async def main():
+    """Run the test suite, then close the shared HTTP client on the same loop."""
+    try:
+        return await run_all_tests()
+    finally:
+        await close_client()
+
+
 if __name__ == "__main__":
     # Run the test suite
-    asyncio.run(run_all_tests())
+    asyncio.run(main())
@@ -12,11 +12,14 @@ NOTE: This requires API keys to be configured in .env
 
 import asyncio
 import os
+import re
+from datetime import datetime
 from pathlib import Path
+
+import aiofiles
 from dotenv import load_dotenv
 
-from app.agents import LeadAgent, ContentGeneratorAgent, IteratorAgent, PublisherAgent
-from app.models.content import ContentSession
+from app.models.content import ContentSession, ContentVersion
 from app.models.parameters import (
     GenerationParameters,
     Tone,
@@ -24,11 +27,16 @@ from app.models.parameters import (
     ContentFormat
 )
 
+_WORDS = re.compile(r"\S+")
+
 
 async def complete_content_creation_workflow():
     """
     Demonstrates the complete workflow from research to publication.
     """
+    # Agents are imported per example so CLI dispatch only loads what it runs
+    from app.agents import LeadAgent, ContentGeneratorAgent, IteratorAgent, PublisherAgent
+
     print("\n" + "=" * 70)
     print("Content Creation Engine - Complete Workflow Example")
     print("=" * 70 + "\n")
@@ -74,9 +82,6 @@ async def complete_content_creation_workflow():
 
     # This would normally generate content from research
     # For this example, we'll create a mock version
-    from app.models.content import ContentVersion
-    from datetime import datetime
-
     initial_content = """# Best Practices for Python Async Programming
 
 ## Introduction
@@ -117,8 +122,11 @@ Async programming can significantly improve application performance when used co
     )
 
     print("✓ Initial content generated")
-    print(f"  Length: {len(initial_content.split())} words")
-    print(f"  Sections: {initial_content.count('##')}")
+    word_count = sum(1 for _ in _WORDS.finditer(initial_content))
+    # Only count "## " headings at line start, not "###" subsections
+    section_count = initial_content.count("\n## ") + initial_content.startswith("## ")
+    print(f"  Length: {word_count} words")
+    print(f"  Sections: {section_count}")
     print("\n--- Preview (first 200 chars) ---")
     print(initial_content[:200] + "...\n")
 
@@ -150,56 +158,74 @@ Async programming can significantly improve application performance when used co
     print("    2. Generate improved content version")
     print("    3. Save as version 2\n")
 
+    # Steps 6-8 are independent, so run them concurrently
+    publisher = PublisherAgent(session)
+
+    load_dotenv()
+
+    wp_url = os.getenv("WP_SITE_URL")
+    wp_user = os.getenv("WP_USERNAME")
+    wp_pass = os.getenv("WP_APP_PASSWORD")
+
+    # Publishing is skipped in this example. To actually publish, use:
+    # wp_task = publisher.publish_to_wordpress(
+    #     site_url=wp_url,
+    #     username=wp_user,
+    #     app_password=wp_pass,
+    #     status="draft"
+    # )
+    wp_task = asyncio.sleep(0)
+
+    verify_result, html_result, wp_result = await asyncio.gather(
+        publisher.verify_citations(),
+        asyncio.to_thread(publisher.export_to_html_stream, include_styles=True),
+        wp_task,
+        return_exceptions=True
+    )
+
     # Step 6: Verify citations
     print("Step 6: Verifying citations...")
 
-    publisher = PublisherAgent(session)
-
-    # Note: Skipping actual verification for example
-    print("  (Skipping actual verification - would check all links)")
-    print("  In production, this validates all markdown links\n")
+    if isinstance(verify_result, Exception):
+        print(f"✗ Citation verification failed: {verify_result}\n")
+    else:
+        print(f"✓ Checked {verify_result['total_links']} links")
+        print(f"  Valid: {len(verify_result['valid'])}, invalid: {len(verify_result['invalid'])}\n")
 
     # Step 7: Export to HTML
     print("Step 7: Exporting to HTML...")
 
-    html_result = publisher.export_to_html(include_styles=True)
+    if isinstance(html_result, Exception):
+        raise html_result
 
     print(f"✓ HTML export complete")
     print(f"  Filename: {html_result['filename']}")
     print(f"  Title: {html_result['title']}")
-    print(f"  Size: {len(html_result['html'])} bytes")
 
-    # Save to file
+    # Save to file, writing the document chunk by chunk
     output_path = Path("output") / html_result['filename']
     output_path.parent.mkdir(exist_ok=True)
 
-    with open(output_path, 'w') as f:
-        f.write(html_result['html'])
+    size = 0
+    async with aiofiles.open(output_path, 'w') as f:
+        for chunk in html_result['chunks']:
+            size += len(chunk)
+            await f.write(chunk)
 
+    print(f"  Size: {size} bytes")
     print(f"  Saved to: {output_path.absolute()}\n")
 
     # Step 8: WordPress publishing (optional)
     print("Step 8: WordPress publishing...")
 
-    load_dotenv()
-
-    wp_url = os.getenv("WP_SITE_URL")
-    wp_user = os.getenv("WP_USERNAME")
-    wp_pass = os.getenv("WP_APP_PASSWORD")
-
     if wp_url and wp_user and wp_pass:
         print("  WordPress credentials found in .env")
-        print("  (Skipping actual publish - remove this check to publish)")
+        print("  (Skipping actual publish - see wp_task above to publish)")
         print(f"  Would publish to: {wp_url}")
-
-        # To actually publish:
-        # wp_result = await publisher.publish_to_wordpress(
-        #     site_url=wp_url,
-        #     username=wp_user,
-        #     app_password=wp_pass,
-        #     status="draft"
-        # )
-        # print(f"  Published! Edit at: {wp_result['edit_url']}")
+        if isinstance(wp_result, Exception):
+            print(f"  ✗ Publishing failed: {wp_result}")
+        elif wp_result:
+            print(f"  Published! Edit at: {wp_result['edit_url']}")
     else:
         print("  WordPress not configured (set WP_* vars in .env)")
 
@@ -221,13 +247,12 @@ async def iterator_example():
     """
     Focused example showing Iterator Agent capabilities.
     """
+    from app.agents.iterator import IteratorAgent
+
     print("\n" + "=" * 70)
     print("Iterator Agent Example")
     print("=" * 70 + "\n")
 
-    from app.models.content import ContentVersion
-    from datetime import datetime
-
     # Create session with existing content
     session = ContentSession(
         topic="Python Testing Best Practices",
@@ -279,10 +304,19 @@ That's all."""
     for i, feedback in enumerate(feedback_examples, 1):
         print(f"{i}. \"{feedback}\"")
 
-        # Analyze each (requires API key)
-        # analysis = await iterator.analyze_feedback(feedback)
-        # print(f"   → Action: {analysis.get('action')}")
-        # print(f"   → Changes: {analysis.get('specific_changes')[:80]}...\n")
+    # Analyze each (requires API key). The analyses are independent API
+    # calls, so run them concurrently, bounded by a semaphore:
+    # sem = asyncio.Semaphore(4)
+    #
+    # async def analyze(feedback):
+    #     async with sem:
+    #         return await iterator.analyze_feedback(feedback)
+    #
+    # analyses = await asyncio.gather(*(analyze(fb) for fb in feedback_examples))
+    # for feedback, analysis in zip(feedback_examples, analyses):
+    #     print(f"\"{feedback}\"")
+    #     print(f"   → Action: {analysis.get('action')}")
+    #     print(f"   → Changes: {analysis.get('specific_changes')[:80]}...\n")
 
     print("\n(Analysis requires Anthropic API key)")
     print("=" * 70 + "\n")
@@ -292,13 +326,12 @@ async def publisher_example():
     """
     Focused example showing Publisher Agent capabilities.
     """
+    from app.agents.publisher import PublisherAgent
+
     print("\n" + "=" * 70)
     print("Publisher Agent Example")
     print("=" * 70 + "\n")
 
-    from app.models.content import ContentVersion
-    from datetime import datetime
-
     # Create session with polished content
     session = ContentSession(
         topic="Introduction to Docker",
@@ -372,13 +405,24 @@ Docker simplifies deployment and ensures consistency across environments."""
 async def main():
     """Run all examples."""
     import sys
+    from app.tools.http_client import close_client
+
+    # All examples share one event loop, so the pooled HTTP client is reused
+    # across them and closed once at the end
+    try:
+        await _run_examples(sys.argv[1:])
+    finally:
+        await close_client()
+
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "iterator":
+async def _run_examples(args):
+    """Dispatch to the requested example, or run them all."""
+    if args:
+        if args[0] == "iterator":
             await iterator_example()
-        elif sys.argv[1] == "publisher":
+        elif args[0] == "publisher":
             await publisher_example()
-        elif sys.argv[1] == "full":
+        elif args[0] == "full":
             await complete_content_creation_workflow()
         else:
             print("Usage: python example_workflow.py [full|iterator|publisher]")
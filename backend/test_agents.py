@@ -12,13 +12,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 # Mock the models and config to avoid import errors
-from unittest.mock import MagicMock
+from types import SimpleNamespace
 import app.models.content as content_models
 import app.config as config_module
 
-# Create mock settings
-config_module.settings = MagicMock()
-config_module.settings.memory_base_path = Path("app/memory")
+# Create mock settings (plain attributes, seeded from the real settings so
+# modules that read other fields at import time still find them)
+config_module.settings = SimpleNamespace(
+    **{**config_module.settings.model_dump(), "memory_base_path": Path("app/memory")}
+)
 
 def test_agent_structure():
     """Test that agent classes have correct structure."""
@@ -29,7 +31,7 @@ def test_agent_structure():
     print("✓ Content Generator Agent imported successfully")
 
     # Check Lead Agent methods
-    lead_methods = [
+    lead_methods = {
         'analyze_complexity',
         'create_research_plan',
         'execute_research',
@@ -37,29 +39,29 @@ def test_agent_structure():
         'decide_more_research',
         'run_full_research',
         'get_state'
-    ]
+    }
 
-    for method in lead_methods:
-        if not hasattr(LeadAgent, method):
-            print(f"✗ LeadAgent missing method: {method}")
-            return False
-        print(f"✓ LeadAgent.{method} exists")
+    missing = lead_methods - set(dir(LeadAgent))
+    if missing:
+        print(f"✗ LeadAgent missing methods: {', '.join(sorted(missing))}")
+        return False
+    print(f"✓ LeadAgent has all {len(lead_methods)} required methods")
 
     # Check Generator Agent methods
-    generator_methods = [
+    generator_methods = {
         'read_research',
         'plan_structure',
         'generate_content',
         'generate_stream',
         'run_generation',
         'get_state'
-    ]
+    }
 
-    for method in generator_methods:
-        if not hasattr(ContentGeneratorAgent, method):
-            print(f"✗ ContentGeneratorAgent missing method: {method}")
-            return False
-        print(f"✓ ContentGeneratorAgent.{method} exists")
+    missing = generator_methods - set(dir(ContentGeneratorAgent))
+    if missing:
+        print(f"✗ ContentGeneratorAgent missing methods: {', '.join(sorted(missing))}")
+        return False
+    print(f"✓ ContentGeneratorAgent has all {len(generator_methods)} required methods")
 
     print("\n✓ All required methods present")
     return True
@@ -13,38 +13,49 @@ Usage:
     python test_client.py
 """
 
-import httpx
+from __future__ import annotations
+
+import io
 import json
+import re
 import sys
-from typing import AsyncIterator
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict
+
+# The HTTP stack is only imported once the client actually runs
+if TYPE_CHECKING:
+    import httpx
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 BASE_URL = "http://localhost:8000"
 
 
-async def create_session(topic: str, content_type: str = "blog_post") -> str:
+async def create_session(client: httpx.AsyncClient, topic: str, content_type: str = "blog_post") -> str:
     """Create a new content creation session."""
     print(f"\n{'='*60}")
     print("Creating new session...")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{BASE_URL}/api/sessions",
-            json={
-                "topic": topic,
-                "parameters": {
-                    "content_type": content_type,
-                    "tone": "professional",
-                    "audience_level": "intermediate",
-                    "word_count": 1000,
-                    "keywords": [],
-                    "custom_instructions": None
-                }
+    response = await client.post(
+        "/api/sessions",
+        json={
+            "topic": topic,
+            "parameters": {
+                "content_type": content_type,
+                "tone": "professional",
+                "audience_level": "intermediate",
+                "word_count": 1000,
+                "keywords": [],
+                "custom_instructions": None
             }
-        )
-        response.raise_for_status()
-        data = response.json()
+        }
+    )
+    response.raise_for_status()
+    data = response.json()
 
     session_id = data["session_id"]
     print(f"✓ Session created: {session_id}")
@@ -55,95 +66,164 @@ async def create_session(topic: str, content_type: str = "blog_post") -> str:
     return session_id
 
 
-async def stream_research(session_id: str):
+# Matches an SSE "event:" or "data:" field line, parsed without decoding
+_SSE_FIELD = re.compile(rb"(event|data):[ ]?(.*)")
+
+
+def _dispatch(
+    handlers: Dict[str, Callable[[Dict[str, Any]], None]],
+    event_type: str,
+    data: Any
+):
+    """Decode an event's JSON data and pass it to the handler for its type."""
+    handler = handlers.get(event_type)
+    if handler is None:
+        return
+    try:
+        payload = _loads(data)
+    except json.JSONDecodeError:  # orjson's error subclasses this
+        return
+    handler(payload)
+
+
+async def consume_events(
+    client: httpx.AsyncClient,
+    path: str,
+    handlers: Dict[str, Callable[[Dict[str, Any]], None]]
+):
+    """POST to an SSE endpoint and dispatch each event's JSON data by event type."""
+    try:
+        from httpx_sse import aconnect_sse
+    except ImportError:
+        await _consume_raw_events(client, path, handlers)
+        return
+
+    async with aconnect_sse(client, "POST", path) as event_source:
+        event_source.response.raise_for_status()
+
+        async for event in event_source.aiter_sse():
+            _dispatch(handlers, event.event, event.data)
+
+
+async def _consume_raw_events(
+    client: httpx.AsyncClient,
+    path: str,
+    handlers: Dict[str, Callable[[Dict[str, Any]], None]]
+):
+    """Fallback SSE reader for when httpx-sse is not installed."""
+    async with client.stream("POST", path, headers={"Accept": "text/event-stream"}) as response:
+        response.raise_for_status()
+
+        event_type, data_lines, tail = b"message", [], b""
+        async for chunk in response.aiter_bytes():
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            for line in lines:
+                line = line.rstrip(b"\r")
+                if not line:
+                    # A blank line ends the event
+                    if data_lines:
+                        _dispatch(handlers, event_type.decode(), b"\n".join(data_lines))
+                    event_type, data_lines = b"message", []
+                    continue
+                match = _SSE_FIELD.fullmatch(line)
+                if match is None:
+                    continue  # comments and other fields
+                if match.group(1) == b"event":
+                    event_type = match.group(2)
+                else:
+                    data_lines.append(match.group(2))
+
+
+def print_status(data: Dict[str, Any]):
+    """Print a status event."""
+    print(f"  [{data['phase'].upper()}] {data['message']}")
+
+
+def print_research_complete(data: Dict[str, Any]):
+    """Print the research completion summary."""
+    print(f"  ✓ COMPLETE: {data['total_sources']} sources found")
+    print(f"\n  Synthesis preview:")
+    print(f"  {data['synthesis_preview'][:200]}...")
+
+
+RESEARCH_HANDLERS = {
+    "status": print_status,
+    "complexity": lambda data: print(f"  ✓ Complexity: {data['complexity']}"),
+    "plan": lambda data: print(f"  ✓ Research plan: {data['tasks']} tasks"),
+    "research_progress": lambda data: print(
+        f"  ✓ Progress: {data['agents_completed']}/{data['total_agents']} agents"
+    ),
+    "complete": print_research_complete,
+}
+
+
+async def stream_research(client: httpx.AsyncClient, session_id: str):
     """Start research with SSE streaming."""
     print(f"\n{'='*60}")
     print("Starting research (streaming)...")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        async with client.stream(
-            "POST",
-            f"{BASE_URL}/api/sessions/{session_id}/research",
-            headers={"Accept": "text/event-stream"}
-        ) as response:
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                if line.startswith("event:"):
-                    event_type = line.split(":", 1)[1].strip()
-                elif line.startswith("data:"):
-                    data_str = line.split(":", 1)[1].strip()
-                    try:
-                        data = json.loads(data_str)
-                        if event_type == "status":
-                            print(f"  [{data['phase'].upper()}] {data['message']}")
-                        elif event_type == "complexity":
-                            print(f"  ✓ Complexity: {data['complexity']}")
-                        elif event_type == "plan":
-                            print(f"  ✓ Research plan: {data['tasks']} tasks")
-                        elif event_type == "research_progress":
-                            print(f"  ✓ Progress: {data['agents_completed']}/{data['total_agents']} agents")
-                        elif event_type == "complete":
-                            print(f"  ✓ COMPLETE: {data['total_sources']} sources found")
-                            print(f"\n  Synthesis preview:")
-                            print(f"  {data['synthesis_preview'][:200]}...")
-                    except json.JSONDecodeError:
-                        pass
-
-
-async def stream_generation(session_id: str):
+    await consume_events(client, f"/api/sessions/{session_id}/research", RESEARCH_HANDLERS)
+
+
+async def stream_generation(client: httpx.AsyncClient, session_id: str):
     """Generate content with SSE streaming."""
     print(f"\n{'='*60}")
     print("Generating content (streaming)...")
     print(f"{'='*60}")
 
     content_chunks = []
-
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        async with client.stream(
-            "POST",
-            f"{BASE_URL}/api/sessions/{session_id}/generate",
-            headers={"Accept": "text/event-stream"}
-        ) as response:
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                if line.startswith("event:"):
-                    event_type = line.split(":", 1)[1].strip()
-                elif line.startswith("data:"):
-                    data_str = line.split(":", 1)[1].strip()
-                    try:
-                        data = json.loads(data_str)
-                        if event_type == "status":
-                            print(f"  [{data['phase'].upper()}] {data['message']}")
-                        elif event_type == "outline":
-                            print(f"  ✓ Outline created")
-                            print(f"\n{data['content'][:300]}...\n")
-                        elif event_type == "content_start":
-                            print(f"  ✓ Generating content...")
-                        elif event_type == "content":
-                            chunk = data['chunk']
-                            content_chunks.append(chunk)
-                            # Print first few chunks to show progress
-                            if len(content_chunks) < 10:
-                                print(chunk, end='', flush=True)
-                        elif event_type == "complete":
-                            print(f"\n  ✓ COMPLETE: Version {data['version']} generated")
-                    except json.JSONDecodeError:
-                        pass
-
-
-async def get_content(session_id: str) -> str:
+    # Progress output is buffered and written in one go rather than
+    # flushing stdout for every chunk
+    preview = io.StringIO()
+
+    def flush_preview():
+        if preview.tell():
+            sys.stdout.write(preview.getvalue())
+            preview.seek(0)
+            preview.truncate()
+
+    def on_status(data: Dict[str, Any]):
+        flush_preview()
+        print_status(data)
+
+    def on_outline(data: Dict[str, Any]):
+        print(f"  ✓ Outline created")
+        print(f"\n{data['content'][:300]}...\n")
+
+    def on_content(data: Dict[str, Any]):
+        chunk = data['chunk']
+        content_chunks.append(chunk)
+        # Show the first few chunks to indicate progress
+        if len(content_chunks) < 10:
+            preview.write(chunk)
+            if preview.tell() > 65536:
+                flush_preview()
+
+    def on_complete(data: Dict[str, Any]):
+        flush_preview()
+        print(f"\n  ✓ COMPLETE: Version {data['version']} generated")
+
+    await consume_events(client, f"/api/sessions/{session_id}/generate", {
+        "status": on_status,
+        "outline": on_outline,
+        "content_start": lambda data: print(f"  ✓ Generating content..."),
+        "content": on_content,
+        "complete": on_complete,
+    })
+    flush_preview()
+
+
+async def get_content(client: httpx.AsyncClient, session_id: str) -> str:
     """Get the final content."""
     print(f"\n{'='*60}")
     print("Retrieving final content...")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/api/sessions/{session_id}/content")
-        response.raise_for_status()
-        data = response.json()
+    response = await client.get(f"/api/sessions/{session_id}/content")
+    response.raise_for_status()
+    data = response.json()
 
     print(f"✓ Content retrieved")
     print(f"  Version: {data['version_number']}")
@@ -156,45 +236,45 @@ async def get_content(session_id: str) -> str:
     return data['content']
 
 
-async def export_html(session_id: str):
-    """Export content as HTML."""
+async def export_html(client: httpx.AsyncClient, session_id: str):
+    """Export content as HTML, streaming the download straight to disk."""
     print(f"\n{'='*60}")
     print("Exporting as HTML...")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(f"{BASE_URL}/api/sessions/{session_id}/publish/html")
+    async with client.stream("GET", f"/api/sessions/{session_id}/download") as response:
         response.raise_for_status()
-        data = response.json()
+        disposition = response.headers.get("content-disposition", "")
+        filename = disposition.partition("filename=")[2].strip('"') or f"{session_id}.html"
+        path = f"/tmp/{filename}"
 
-    print(f"✓ HTML exported")
-    print(f"  Filename: {data['filename']}")
-    print(f"  Title: {data['title']}")
-    print(f"  Size: {len(data['html'])} characters")
+        size = 0
+        with open(path, "wb") as f:
+            async for chunk in response.aiter_bytes(1 << 16):
+                size += len(chunk)
+                f.write(chunk)
 
-    # Save to file
-    with open(f"/tmp/{data['filename']}", "w") as f:
-        f.write(data["html"])
-    print(f"  Saved to: /tmp/{data['filename']}")
+    print(f"✓ HTML exported")
+    print(f"  Filename: {filename}")
+    print(f"  Size: {size} bytes")
+    print(f"  Saved to: {path}")
 
 
-async def get_session_info(session_id: str):
+async def get_session_info(client: httpx.AsyncClient, session_id: str):
     """Get session information."""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{BASE_URL}/api/sessions/{session_id}")
-        response.raise_for_status()
-        return response.json()
+    response = await client.get(f"/api/sessions/{session_id}")
+    response.raise_for_status()
+    return response.json()
 
 
-async def delete_session(session_id: str):
+async def delete_session(client: httpx.AsyncClient, session_id: str):
     """Delete the session."""
     print(f"\n{'='*60}")
     print("Cleaning up...")
     print(f"{'='*60}")
 
-    async with httpx.AsyncClient() as client:
-        response = await client.delete(f"{BASE_URL}/api/sessions/{session_id}")
-        response.raise_for_status()
+    response = await client.delete(f"/api/sessions/{session_id}")
+    response.raise_for_status()
 
     print(f"✓ Session deleted: {session_id}")
 
@@ -205,12 +285,25 @@ async def main():
     print("Content Creation Engine - Test Client")
     print("="*60)
 
+    import httpx
+
+    # One client for the whole workflow so connections are kept alive
+    # between steps
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=httpx.Timeout(300.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=4)
+    ) as client:
+        await run_workflow(client)
+
+
+async def run_workflow(client: httpx.AsyncClient):
+    """Check the server is up, then run each workflow step."""
     # Check if server is running
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(f"{BASE_URL}/health")
-            response.raise_for_status()
-            print("✓ Server is running")
+        response = await client.get("/health")
+        response.raise_for_status()
+        print("✓ Server is running")
     except Exception as e:
         print(f"✗ Server not running: {e}")
         print(f"\nStart the server with:")
@@ -220,24 +313,25 @@ async def main():
     try:
         # 1. Create session
         session_id = await create_session(
+            client,
             topic="Best practices for building RESTful APIs",
             content_type="technical_tutorial"
         )
 
         # 2. Research
-        await stream_research(session_id)
+        await stream_research(client, session_id)
 
         # 3. Generate content
-        await stream_generation(session_id)
+        await stream_generation(client, session_id)
 
         # 4. Get final content
-        content = await get_content(session_id)
+        content = await get_content(client, session_id)
 
         # 5. Export as HTML
-        await export_html(session_id)
+        await export_html(client, session_id)
 
         # 6. Show final session state
-        session_info = await get_session_info(session_id)
+        session_info = await get_session_info(client, session_id)
         print(f"\n{'='*60}")
         print("Final Session State:")
         print(f"{'='*60}")
@@ -247,7 +341,7 @@ async def main():
         print(f"  Versions: {session_info['versions_count']}")
 
         # 7. Clean up
-        await delete_session(session_id)
+        await delete_session(client, session_id)
 
         print(f"\n{'='*60}")
         print("✓ Test workflow completed successfully!")
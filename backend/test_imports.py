@@ -1,33 +1,15 @@
-"""Quick test to verify all imports work correctly."""
+"""
+Quick test to verify all imports work correctly.
 
-print("Testing imports...")
+The checks live in test_api.test_imports; this entry point is kept so
+``python test_imports.py`` still works without CI importing the module
+graph twice.
+"""
 
-try:
-    from app.config import settings
-    print("✓ Config imported successfully")
-except Exception as e:
-    print(f"✗ Config import failed: {e}")
+import sys
 
-try:
-    from app.models import (
-        ContentType, Tone, AudienceLevel, GenerationParameters,
-        SessionStatus, Complexity, ResearchResult, ContentVersion,
-        AgentState, ContentSession
-    )
-    print("✓ All models imported successfully")
-except Exception as e:
-    print(f"✗ Models import failed: {e}")
+from test_api import test_imports
 
-try:
-    from app.agents.base import BaseAgent
-    print("✓ BaseAgent imported successfully")
-except Exception as e:
-    print(f"✗ BaseAgent import failed: {e}")
 
-try:
-    from app.main import app
-    print("✓ FastAPI app imported successfully")
-except Exception as e:
-    print(f"✗ FastAPI app import failed: {e}")
-
-print("\nAll imports successful! Ready to run.")
+if __name__ == "__main__":
+    sys.exit(0 if test_imports() else 1)
@@ -14,8 +14,9 @@ async def test_iterator_agent():
     """Test Iterator Agent feedback analysis."""
     print("Testing Iterator Agent...")
 
-    # Create a test session with a content version
-    session = ContentSession(
+    # Sessions and versions are test fixtures built with model_construct to
+    # skip validation, which is not what these tests cover
+    session = ContentSession.model_construct(
         topic="Python Best Practices",
         parameters=GenerationParameters(
             tone=Tone.PROFESSIONAL,
@@ -26,7 +27,7 @@ async def test_iterator_agent():
 
     # Add a mock content version
     session.versions.append(
-        ContentVersion(
+        ContentVersion.model_construct(
             version_number=1,
             content="# Python Best Practices\n\nPython is a great language. Use PEP 8.",
             generated_at=datetime.utcnow()
@@ -50,8 +51,8 @@ def test_publisher_agent():
     """Test Publisher Agent HTML export."""
     print("Testing Publisher Agent...")
 
-    # Create a test session with content
-    session = ContentSession(
+    # Create a test session with content (unvalidated fixture, as above)
+    session = ContentSession.model_construct(
         topic="Python Best Practices",
         parameters=GenerationParameters(
             tone=Tone.PROFESSIONAL,
@@ -62,7 +63,7 @@ def test_publisher_agent():
 
     # Add a mock content version
     session.versions.append(
-        ContentVersion(
+        ContentVersion.model_construct(
             version_number=1,
             content="""# Python Best Practices
 
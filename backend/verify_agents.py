@@ -3,33 +3,58 @@ Verify that the agent modules are properly structured without running them.
 """
 
 import ast
+import functools
 import sys
 from pathlib import Path
 
 
+class _StructureVisitor(ast.NodeVisitor):
+    """Collect class, function and import names in a single tree traversal."""
+
+    MAX_IMPORTS = 10
+
+    def __init__(self):
+        self.classes = []
+        self.functions = []
+        self.imports = []
+
+    def visit_ClassDef(self, node):
+        self.classes.append(node.name)
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self.functions.append(node.name)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_ImportFrom(self, node):
+        if len(self.imports) < self.MAX_IMPORTS:
+            self.imports.append(f"from {node.module} import {', '.join([a.name for a in node.names])}")
+
+    def visit_Import(self, node):
+        if len(self.imports) < self.MAX_IMPORTS:
+            self.imports.append(f"import {', '.join([a.name for a in node.names])}")
+
+
+@functools.lru_cache(maxsize=None)
 def verify_python_file(file_path: Path) -> dict:
     """Verify a Python file's structure."""
-    with open(file_path) as f:
-        code = f.read()
+    # Bytes go straight to the parser, which handles the source encoding
+    with open(file_path, "rb") as f:
+        source = f.read()
 
     try:
-        tree = ast.parse(code)
-
-        classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-        functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-        imports = []
+        tree = ast.parse(source, filename=str(file_path))
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ImportFrom):
-                imports.append(f"from {node.module} import {', '.join([a.name for a in node.names])}")
-            elif isinstance(node, ast.Import):
-                imports.append(f"import {', '.join([a.name for a in node.names])}")
+        visitor = _StructureVisitor()
+        visitor.visit(tree)
 
         return {
             "valid": True,
-            "classes": classes,
-            "functions": functions,
-            "imports": imports[:10],  # First 10 imports
+            "classes": visitor.classes,
+            "functions": visitor.functions,
+            "imports": visitor.imports,  # First 10 imports
             "error": None
         }
     except SyntaxError as e:
@@ -102,10 +127,9 @@ def main():
         all_valid = False
 
     # Check __init__.py exports
-    init_result = verify_python_file(files["__init__.py"])
-    with open(files["__init__.py"]) as f:
+    with open(files["__init__.py"], "rb") as f:
         init_content = f.read()
-        if "IteratorAgent" in init_content and "PublisherAgent" in init_content:
+        if b"IteratorAgent" in init_content and b"PublisherAgent" in init_content:
             print("✓ Both agents exported in __init__.py")
         else:
             print("✗ Agents NOT properly exported in __init__.py")
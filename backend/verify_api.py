@@ -4,17 +4,52 @@ Quick verification script to check if the API layer is properly set up.
 Run this before starting the server to catch any issues early.
 """
 
+import argparse
+import contextlib
+import hashlib
+import importlib
+import importlib.metadata
+import io
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
 
-# Add backend to path
-sys.path.insert(0, str(Path(__file__).parent))
+# Section rule used by every report header
+_SEP = "=" * 70
 
+# Route list from the last successful app load, keyed by the app source mtimes
+_routes_cache_path = Path(".verify_cache.json")
 
-def check_file_exists(filepath: str, description: str) -> bool:
-    """Check if a required file exists."""
-    path = Path(filepath)
-    if path.exists():
+
+def _known_files(filepaths: List[str]) -> Set[str]:
+    """
+    Collect the existing entries of every directory containing one of the given paths.
+
+    Only those directories are listed, once each, rather than walking the
+    tree, so session data under app/memory and caches are never scanned.
+
+    Args:
+        filepaths: Relative file paths
+
+    Returns:
+        Set of relative paths (joined like the inputs) that exist on disk
+    """
+    known = set()
+    for directory in {os.path.dirname(filepath) for filepath in filepaths}:
+        try:
+            with os.scandir(directory or ".") as entries:
+                known.update(os.path.join(directory, entry.name) for entry in entries)
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+    return known
+
+
+def check_file_exists(filepath: str, description: str, known: Set[str]) -> bool:
+    """Check if a required file exists, using the pre-collected set of known paths."""
+    if filepath in known:
         print(f"✓ {description}: {filepath}")
         return True
     else:
@@ -24,9 +59,9 @@ def check_file_exists(filepath: str, description: str) -> bool:
 
 def verify_file_structure():
     """Verify that all required files exist."""
-    print("=" * 70)
+    print(_SEP)
     print("Verifying File Structure")
-    print("=" * 70)
+    print(_SEP)
 
     required_files = [
         ("app/main.py", "Main FastAPI app"),
@@ -55,19 +90,33 @@ def verify_file_structure():
         (".env.example", "Environment example"),
     ]
 
+    # One directory listing per parent directory instead of a stat per file
+    known = _known_files([filepath for filepath, _ in required_files])
+
     results = []
     for filepath, description in required_files:
-        result = check_file_exists(filepath, description)
+        result = check_file_exists(filepath, description, known)
         results.append(result)
 
     return all(results)
 
 
+def _try_import(module: str) -> Optional[ImportError]:
+    """Import a module, returning the ImportError instead of raising it."""
+    if module in sys.modules:
+        return None
+    try:
+        importlib.import_module(module)
+        return None
+    except ImportError as e:
+        return e
+
+
 def verify_imports():
     """Verify that all critical imports work."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verifying Python Imports")
-    print("=" * 70)
+    print(_SEP)
 
     imports = [
         ("fastapi", "FastAPI framework"),
@@ -80,13 +129,26 @@ def verify_imports():
         ("sse_starlette.sse", "SSE streaming"),
     ]
 
+    # Import the packages on worker threads to overlap their file I/O;
+    # results are printed afterwards in list order
+    modules = [module for module, _ in imports]
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        outcomes = list(executor.map(_try_import, modules))
+
+    # Packages sharing dependencies (e.g. sse_starlette and uvicorn) can see
+    # each other partially initialized when imported concurrently, so only
+    # a failure that repeats on a serial retry counts as missing
+    outcomes = [
+        error if error is None else _try_import(module)
+        for module, error in zip(modules, outcomes)
+    ]
+
     results = []
-    for module, description in imports:
-        try:
-            __import__(module)
+    for (module, description), error in zip(imports, outcomes):
+        if error is None:
             print(f"✓ {description}: {module}")
             results.append(True)
-        except ImportError:
+        else:
             print(f"✗ MISSING {description}: {module}")
             print(f"  Install with: pip install {module}")
             results.append(False)
@@ -96,9 +158,9 @@ def verify_imports():
 
 def verify_app_imports():
     """Verify that app modules can be imported."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verifying App Module Imports")
-    print("=" * 70)
+    print(_SEP)
 
     app_modules = [
         ("app.config", "Configuration"),
@@ -114,31 +176,96 @@ def verify_app_imports():
         ("app.main", "Main app"),
     ]
 
+    # app.main imports every other module in the list, so load it first and
+    # only import individually whatever it failed to pull in; that also
+    # reports the error from the module that actually broke
+    _try_import("app.main")
+
     results = []
     for module, description in app_modules:
-        try:
-            __import__(module)
+        error = _try_import(module)
+        if error is None:
             print(f"✓ {description}: {module}")
             results.append(True)
-        except ImportError as e:
+        else:
             print(f"✗ FAILED {description}: {module}")
-            print(f"  Error: {e}")
+            print(f"  Error: {error}")
             results.append(False)
 
     return all(results)
 
 
+def _app_source_hash() -> str:
+    """
+    Hash the modification times of every Python file under app/, plus the
+    installed FastAPI and Starlette versions.
+
+    Returns:
+        Hex digest that changes whenever an app source file is added, removed
+        or edited, or either framework is upgraded, downgraded or uninstalled
+    """
+    h = hashlib.sha256()
+    for package in ("fastapi", "starlette"):
+        try:
+            version = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            version = "missing"
+        h.update(f"{package}=={version}\n".encode())
+    for p in sorted(Path("app").rglob("*.py")):
+        h.update(f"{p.relative_to('.')}:{p.stat().st_mtime_ns}\n".encode())
+    return h.hexdigest()
+
+
+def _load_route_paths(source_hash: str) -> Optional[List[str]]:
+    """
+    Load the cached route list if it was recorded for the current sources.
+
+    Args:
+        source_hash: Current value of _app_source_hash()
+
+    Returns:
+        The cached route paths, or None if the cache is missing or stale
+    """
+    try:
+        cache = json.loads(_routes_cache_path.read_text())
+    except (OSError, ValueError):
+        return None
+    if cache.get("hash") != source_hash:
+        return None
+    return cache.get("route_paths")
+
+
 def verify_router_registration():
     """Verify that all routers are registered in main app."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verifying Router Registration")
-    print("=" * 70)
+    print(_SEP)
 
     try:
-        from app.main import app
+        # Importing app.main pulls in every router, model, agent and tool, so
+        # reuse the last route list while nothing under app/ has changed. If
+        # it is already loaded (e.g. by verify_app_imports), read it directly
+        source_hash = _app_source_hash()
+        route_list = None
+        if "app.main" not in sys.modules:
+            route_list = _load_route_paths(source_hash)
+        if route_list is None:
+            from app.main import app
+
+            route_list = []
+            for route in app.routes:
+                path = getattr(route, "path", None)
+                if path is not None:
+                    route_list.append(path)
+            try:
+                _routes_cache_path.write_text(
+                    json.dumps({"hash": source_hash, "route_paths": route_list})
+                )
+            except OSError:
+                pass
 
         # Count registered routes
-        route_count = len([r for r in app.routes if hasattr(r, 'path')])
+        route_count = len(route_list)
         print(f"✓ Total routes registered: {route_count}")
 
         # Check for critical endpoints
@@ -151,29 +278,61 @@ def verify_router_registration():
             "/api/sessions/{session_id}/publish/wordpress",
         ]
 
-        route_paths = {r.path for r in app.routes if hasattr(r, 'path')}
+        missing = frozenset(required_paths).difference(route_list)
 
-        results = []
         for path in required_paths:
-            if path in route_paths:
-                print(f"✓ Endpoint registered: {path}")
-                results.append(True)
-            else:
+            if path in missing:
                 print(f"✗ MISSING endpoint: {path}")
-                results.append(False)
+            else:
+                print(f"✓ Endpoint registered: {path}")
 
-        return all(results)
+        return not missing
 
     except Exception as e:
         print(f"✗ Failed to load app: {e}")
         return False
 
 
+def _parse_env(text: str) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines from a .env file in a single pass.
+
+    Blank lines, comments and lines without a valid key are skipped. An
+    optional ``export`` prefix, surrounding whitespace and matching quotes
+    around the value are stripped.
+
+    Args:
+        text: Contents of the .env file
+
+    Returns:
+        Dictionary mapping each variable name to its value
+    """
+    env = {}
+    i, length = 0, len(text)
+    while i < length:
+        end = text.find("\n", i)
+        if end == -1:
+            end = length
+        eq = text.find("=", i, end)
+        if eq != -1:
+            key = text[i:eq].strip()
+            if key.startswith("export "):
+                key = key[len("export "):].lstrip()
+            # Also rejects comments and keys containing spaces
+            if key.isidentifier():
+                value = text[eq + 1:end].strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+                    value = value[1:-1]
+                env[key] = value
+        i = end + 1
+    return env
+
+
 def verify_environment():
     """Check environment configuration."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verifying Environment Configuration")
-    print("=" * 70)
+    print(_SEP)
 
     env_file = Path(".env")
 
@@ -187,44 +346,46 @@ def verify_environment():
         env_content = f.read()
 
     required_vars = ["ANTHROPIC_API_KEY"]
+    env = _parse_env(env_content)
     results = []
 
     for var in required_vars:
-        if f"{var}=" in env_content:
-            # Check if it has a real value (not the example)
-            if f"{var}=sk-ant-" in env_content:
-                # Check if it's not the example placeholder
-                if "..." not in env_content.split(f"{var}=")[1].split("\n")[0]:
-                    print(f"✓ {var} is set")
-                    results.append(True)
-                else:
-                    print(f"⚠ {var} appears to be placeholder value")
-                    results.append(False)
-            else:
-                print(f"⚠ {var} is set but may be invalid")
-                results.append(True)
-        else:
+        value = env.get(var)
+        if value is None:
             print(f"✗ {var} not found in .env")
             results.append(False)
+        elif value.startswith("sk-ant-"):
+            # Check if it's not the example placeholder
+            if "..." not in value:
+                print(f"✓ {var} is set")
+                results.append(True)
+            else:
+                print(f"⚠ {var} appears to be placeholder value")
+                results.append(False)
+        else:
+            print(f"⚠ {var} is set but may be invalid")
+            results.append(True)
 
     return all(results)
 
 
 def verify_memory_directory():
     """Check memory directory setup."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verifying Memory Directory")
-    print("=" * 70)
+    print(_SEP)
 
     memory_dir = Path("app/memory")
 
     try:
         memory_dir.mkdir(parents=True, exist_ok=True)
 
-        # Test write permissions
-        test_file = memory_dir / "test_write.txt"
-        test_file.write_text("test")
-        test_file.unlink()
+        # Test write permissions; access(2) can report false negatives on
+        # network and FUSE filesystems, so confirm a "no" with a real write
+        if not os.access(memory_dir, os.W_OK):
+            test_file = memory_dir / "test_write.txt"
+            test_file.write_text("test")
+            test_file.unlink()
 
         print(f"✓ Memory directory ready: {memory_dir.absolute()}")
         print(f"✓ Directory is writable")
@@ -237,9 +398,9 @@ def verify_memory_directory():
 
 def print_summary(results: dict):
     """Print verification summary."""
-    print("\n" + "=" * 70)
+    print("\n" + _SEP)
     print("Verification Summary")
-    print("=" * 70)
+    print(_SEP)
 
     total = len(results)
     passed = sum(1 for v in results.values() if v)
@@ -248,9 +409,9 @@ def print_summary(results: dict):
         status = "✓ PASS" if result else "✗ FAIL"
         print(f"{status:8} {check}")
 
-    print("=" * 70)
+    print(_SEP)
     print(f"Result: {passed}/{total} checks passed")
-    print("=" * 70)
+    print(_SEP)
 
     if passed == total:
         print("\n✅ All checks passed! You're ready to start the server.")
@@ -266,25 +427,76 @@ def print_summary(results: dict):
         return False
 
 
-def main():
-    """Run all verification checks."""
-    print("\n" + "=" * 70)
+def _run_buffered(check: Callable[[], bool]) -> bool:
+    """
+    Run one section with its output buffered, then write it in a single call.
+
+    Each print() on a line-buffered terminal is its own write, so collecting
+    a section first keeps slow TTYs and CI log pipes from paying for dozens
+    of small writes.
+
+    Args:
+        check: Zero-argument function that prints its report and returns a result
+
+    Returns:
+        The function's result
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return check()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
+# CLI name -> (summary label, check), in run order
+CHECKS = {
+    "files": ("File Structure", verify_file_structure),
+    "imports": ("Python Dependencies", verify_imports),
+    "app": ("App Module Imports", verify_app_imports),
+    "routes": ("Router Registration", verify_router_registration),
+    "env": ("Environment Config", verify_environment),
+    "memory": ("Memory Directory", verify_memory_directory),
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the verification checks.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+
+    Returns:
+        Process exit code: 0 if every selected check passed, 1 otherwise
+    """
+    parser = argparse.ArgumentParser(description="Verify the API layer setup.")
+    parser.add_argument(
+        "--check",
+        action="append",
+        choices=list(CHECKS),
+        help="Run only this check (may be repeated; default: all)"
+    )
+    args = parser.parse_args(argv)
+    selected = args.check or list(CHECKS)
+
+    print("\n" + _SEP)
     print("Content Creation Engine - API Layer Verification")
-    print("=" * 70)
+    print(_SEP)
     print()
 
-    results = {
-        "File Structure": verify_file_structure(),
-        "Python Dependencies": verify_imports(),
-        "App Module Imports": verify_app_imports(),
-        "Router Registration": verify_router_registration(),
-        "Environment Config": verify_environment(),
-        "Memory Directory": verify_memory_directory(),
-    }
+    results = {}
+    for name in CHECKS:
+        if name in selected:
+            label, check = CHECKS[name]
+            results[label] = _run_buffered(check)
 
-    success = print_summary(results)
+    success = _run_buffered(lambda: print_summary(results))
     return 0 if success else 1
 
 
 if __name__ == "__main__":
+    # Add backend to path
+    sys.path.insert(0, str(Path(__file__).parent))
     sys.exit(main())